@@ -137,6 +137,7 @@ from .design_rules import (
 
 # Enums
 from .enums import (
+    ChamferCorner,
     ClearanceType,
     FillType,
     FootprintTextType,
@@ -145,6 +146,7 @@ from .enums import (
     JustifyVertical,
     LabelShape,
     LayerType,
+    PadProperty,
     PadShape,
     PadType,
     PinElectricalType,
@@ -181,6 +183,7 @@ from .pad_and_drill import (
     Options,
     Pad,
     Pads,
+    PadsSoA,
     Primitives,
     Shape,
     ZoneConnect,
@@ -248,6 +251,7 @@ from .symbol_library import (
     PinNumbers,
     Pintype,
     Symbol,
+    SymbolGeometry,
 )
 
 # Templates (convenience helpers)
@@ -307,6 +311,7 @@ __all__ = [
     "TokenFlag",
     "SymbolValue",
     # Enums
+    "ChamferCorner",
     "ClearanceType",
     "FillType",
     "FootprintTextType",
@@ -315,6 +320,7 @@ __all__ = [
     "JustifyVertical",
     "LabelShape",
     "LayerType",
+    "PadProperty",
     "PadShape",
     "PadType",
     "PinElectricalType",
@@ -382,6 +388,7 @@ __all__ = [
     "Options",
     "Pad",
     "Pads",
+    "PadsSoA",
     "Primitives",
     "Shape",
     "ZoneConnect",
@@ -425,6 +432,7 @@ __all__ = [
     "PinNumbers",
     "Pintype",
     "Symbol",
+    "SymbolGeometry",
     # Footprint library
     "Attr",
     "Footprint",
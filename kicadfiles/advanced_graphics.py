@@ -29,9 +29,9 @@ class GrArc(NamedObject):
             (start X Y)
             (mid X Y)
             (end X Y)
-            (layer LAYER_DEFINITION)
+            [(layer LAYER_DEFINITION)]
             (width WIDTH)
-            (uuid UUID)
+            [(uuid UUID)]
         )
 
     Args:
@@ -41,7 +41,7 @@ class GrArc(NamedObject):
         stroke: Stroke definition (optional)
         layer: Layer definition (optional)
         width: Line width (deprecated, use stroke) (optional)
-        uuid: Unique identifier
+        uuid: Unique identifier (optional)
     """
 
     __token_name__: ClassVar[str] = "gr_arc"
@@ -72,7 +72,8 @@ class GrArc(NamedObject):
         },
     )
     uuid: Uuid = field(
-        default_factory=lambda: Uuid(), metadata={"description": "Unique identifier"}
+        default_factory=lambda: Uuid(),
+        metadata={"description": "Unique identifier", "required": False},
     )
 
 
@@ -122,10 +123,10 @@ class GrCircle(NamedObject):
     Args:
         center: Center point coordinates
         end: End point defining radius
-        layer: Layer definition
+        layer: Layer definition (optional)
         width: Line width
         fill: Fill definition (optional)
-        uuid: Unique identifier
+        uuid: Unique identifier (optional)
     """
 
     __token_name__: ClassVar[str] = "gr_circle"
@@ -139,7 +140,8 @@ class GrCircle(NamedObject):
         metadata={"description": "End point defining radius"},
     )
     layer: Layer = field(
-        default_factory=lambda: Layer(), metadata={"description": "Layer definition"}
+        default_factory=lambda: Layer(),
+        metadata={"description": "Layer definition", "required": False},
     )
     width: NamedFloat = field(
         default_factory=lambda: NamedFloat("width", 0.0),
@@ -150,7 +152,8 @@ class GrCircle(NamedObject):
         metadata={"description": "Fill definition", "required": False},
     )
     uuid: Uuid = field(
-        default_factory=lambda: Uuid(), metadata={"description": "Unique identifier"}
+        default_factory=lambda: Uuid(),
+        metadata={"description": "Unique identifier", "required": False},
     )
 
 
@@ -797,7 +800,7 @@ class FpRect(NamedObject):
         stroke: Stroke definition (from version 7) (optional)
         fill: Whether the rectangle is filled (yes/no) (optional)
         locked: Whether the rectangle cannot be edited (optional)
-        uuid: Unique identifier
+        uuid: Unique identifier (optional)
     """
 
     __token_name__: ClassVar[str] = "fp_rect"
@@ -839,7 +842,8 @@ class FpRect(NamedObject):
         },
     )
     uuid: Uuid = field(
-        default_factory=lambda: Uuid(), metadata={"description": "Unique identifier"}
+        default_factory=lambda: Uuid(),
+        metadata={"description": "Unique identifier", "required": False},
     )
 
 
@@ -868,7 +872,7 @@ class FpText(NamedObject):
         layer: Layer definition
         hide: Whether text is hidden (optional)
         effects: Text effects
-        uuid: Unique identifier
+        uuid: Unique identifier (optional)
     """
 
     __token_name__: ClassVar[str] = "fp_text"
@@ -900,7 +904,8 @@ class FpText(NamedObject):
         default_factory=lambda: Effects(), metadata={"description": "Text effects"}
     )
     uuid: Uuid = field(
-        default_factory=lambda: Uuid(), metadata={"description": "Unique identifier"}
+        default_factory=lambda: Uuid(),
+        metadata={"description": "Unique identifier", "required": False},
     )
 
 
@@ -1009,21 +1014,39 @@ class FpTextBox(NamedObject):
 class GrLine(FpLine):
     """Graphical line derived from footprint line.
 
-    Inherits all fields from FpLine but uses 'gr_line' token.
+    Inherits all fields from FpLine but uses 'gr_line' token. The layer is
+    optional because custom pad primitives carry none.
+
+    Args:
+        layer: Layer definition (optional)
     """
 
     __token_name__: ClassVar[str] = "gr_line"
 
+    layer: Layer = field(
+        default_factory=lambda: Layer(),
+        metadata={"description": "Layer definition", "required": False},
+    )
+
 
 @dataclass
 class GrRect(FpRect):
     """Graphical rectangle derived from footprint rectangle.
 
-    Inherits all fields from FpRect but uses 'gr_rect' token.
+    Inherits all fields from FpRect but uses 'gr_rect' token. The layer is
+    optional because custom pad primitives carry none.
+
+    Args:
+        layer: Layer definition (optional)
     """
 
     __token_name__: ClassVar[str] = "gr_rect"
 
+    layer: Layer = field(
+        default_factory=lambda: Layer(),
+        metadata={"description": "Layer definition", "required": False},
+    )
+
 
 @dataclass
 class GrPoly(FpPoly):
@@ -1039,7 +1062,16 @@ class GrPoly(FpPoly):
 class GrCurve(FpCurve):
     """Graphical curve derived from footprint curve.
 
-    Inherits all fields from FpCurve but uses 'gr_curve' token.
+    Inherits all fields from FpCurve but uses 'gr_curve' token. The layer is
+    optional because custom pad primitives carry none.
+
+    Args:
+        layer: Layer definition (optional)
     """
 
     __token_name__: ClassVar[str] = "gr_curve"
+
+    layer: Layer = field(
+        default_factory=lambda: Layer(),
+        metadata={"description": "Layer definition", "required": False},
+    )
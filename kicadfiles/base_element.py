@@ -11,17 +11,25 @@ Architecture:
 from __future__ import annotations
 
 import logging
+import sys
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, fields
+from dataclasses import dataclass, field, fields
 from enum import Enum
 from typing import (
+    IO,
+    TYPE_CHECKING,
     Any,
+    Callable,
     ClassVar,
+    Dict,
+    Iterator,
     List,
     Optional,
+    Tuple,
     Type,
     TypeVar,
     Union,
+    cast,
     get_args,
     get_origin,
     get_type_hints,
@@ -38,17 +46,33 @@ T = TypeVar("T", bound="NamedObject")
 # =============================================================================
 
 
+# Enum class -> {str(member.value): member}, filled on first conversion
+_ENUM_VALUE_TABLES: Dict[Type[Enum], Dict[str, Enum]] = {}
+
+
+def _enum_value_table(enum_class: Type[Enum]) -> Dict[str, Enum]:
+    """Return the cached value-string lookup table for an Enum class."""
+    table = _ENUM_VALUE_TABLES.get(enum_class)
+    if table is None:
+        table = {str(member.value): member for member in enum_class}
+        _ENUM_VALUE_TABLES[enum_class] = table
+    return table
+
+
 def _convert_to_type(value: Any, target_type: Type) -> Any:
     """Convert value to target type with Enum support."""
     try:
         if isinstance(target_type, type) and issubclass(target_type, Enum):
             if isinstance(value, int):
                 return target_type(value)
-            try:
-                return target_type(str(value))
-            except ValueError:
-                return target_type[str(value).upper()]
-    except (TypeError, KeyError):
+            # Match by value first, then by member name (e.g. "rect" or "RECT")
+            text = str(value)
+            member = _enum_value_table(target_type).get(text)
+            if member is None:
+                member = target_type.__members__.get(text.upper())
+            if member is not None:
+                return member
+    except TypeError:
         pass
 
     if target_type == int:
@@ -62,6 +86,22 @@ def _convert_to_type(value: Any, target_type: Type) -> Any:
     return value
 
 
+def _emit_value(result: SExpr, value: Any) -> None:
+    """Append an object, list of items or positional primitive."""
+    if isinstance(value, SExpressionBase):
+        result.append(value.to_sexpr())
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            if isinstance(item, SExpressionBase):
+                result.append(item.to_sexpr())
+            else:
+                result.append(item)
+    elif isinstance(value, Enum):
+        result.append(value.value)
+    else:
+        result.append(value)
+
+
 # =============================================================================
 # Parsing Infrastructure
 # =============================================================================
@@ -86,6 +126,8 @@ class ParseCursor:
     parser: SExprParser  # Parser for tracking used indices
     path: List[str]  # Path for debugging
     strictness: ParseStrictness  # Parse strictness level
+    # First index of each token in sexpr, built on the first find_token call
+    _token_index: Optional[Dict[str, int]] = field(default=None, repr=False)
 
     def enter(self, sexpr: SExpr, name: str) -> "ParseCursor":
         """Create new cursor for nested object."""
@@ -188,16 +230,37 @@ class ParseCursor:
             The S-expression as list if found, empty list otherwise.
             Always returns a list for consistent handling.
         """
+        if self._token_index is None:
+            self._token_index = self._build_token_index()
+
+        idx = self._token_index.get(token_name)
+        if idx is None:
+            return []
+        if mark_used:
+            self.parser.mark_used(idx)
+
+        item = self.sexpr[idx]
+        return item if isinstance(item, list) else [item]
+
+    def _build_token_index(self) -> Dict[str, int]:
+        """Map each token (list head or bare symbol) to its first index."""
+        token_index: Dict[str, int] = {}
         for idx, item in enumerate(self.sexpr[1:], start=1):
-            if isinstance(item, list) and item and str(item[0]) == token_name:
-                if mark_used:
-                    self.parser.mark_used(idx)
-                return item
-            elif isinstance(item, (str, Symbol)) and str(item) == token_name:
-                if mark_used:
-                    self.parser.mark_used(idx)
-                return [item]
-        return []
+            if isinstance(item, list):
+                if item:
+                    token_index.setdefault(str(item[0]), idx)
+            elif isinstance(item, (str, Symbol)):
+                token_index.setdefault(str(item), idx)
+        return token_index
+
+
+# Primitive field type -> ParseCursor method, built once instead of per field
+_PRIMITIVE_PARSERS: Dict[Any, Callable[..., Any]] = {
+    int: ParseCursor.parse_int,
+    float: ParseCursor.parse_float,
+    bool: ParseCursor.parse_bool,
+    str: ParseCursor.parse_str,
+}
 
 
 # =============================================================================
@@ -213,6 +276,8 @@ class SExpressionBase(ABC):
         __token_name__: Token identifier for this object (ClassVar)
     """
 
+    __slots__ = ()
+
     __token_name__: ClassVar[str] = ""
 
     @classmethod
@@ -241,6 +306,14 @@ class SExpressionBase(ABC):
 class NamedValue(SExpressionBase):
     """Base class for named primitive wrapper types (str, int, float)."""
 
+    # Set via object.__setattr__ while parsing; subclasses add token and value
+    __slots__ = ("_required",)
+
+    if TYPE_CHECKING:
+        # Declared for the checkers only; the slotted subclasses define them
+        token: str
+        value: Any
+
     base_type: ClassVar[type] = object
 
     def __post_init__(self) -> None:
@@ -332,16 +405,16 @@ class NamedValue(SExpressionBase):
 
     def __eq__(self, other: object) -> bool:
         """Equality comparison based on token and value only."""
-        if not isinstance(other, NamedValue):
+        if self is other:
+            return True
+        if type(self) is not type(other):
             return False
-        return (
-            self.__class__ == other.__class__
-            and getattr(self, "token", "") == getattr(other, "token", "")
-            and getattr(self, "value", None) == getattr(other, "value", None)
-        )
+        return getattr(self, "token", "") == getattr(other, "token", "") and getattr(
+            self, "value", None
+        ) == getattr(other, "value", None)
 
 
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class NamedString(NamedValue):
     """String wrapper for named values."""
 
@@ -350,7 +423,7 @@ class NamedString(NamedValue):
     base_type: ClassVar[type] = str
 
 
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class NamedInt(NamedValue):
     """Integer wrapper for named values."""
 
@@ -359,7 +432,7 @@ class NamedInt(NamedValue):
     base_type: ClassVar[type] = int
 
 
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class NamedFloat(NamedValue):
     """Float wrapper for named values."""
 
@@ -478,6 +551,8 @@ class TokenFlag(TokenBase):
         return [self.token]
 
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, TokenFlag):
             return False
         return self.token == other.token and self.token_value == other.token_value
@@ -528,6 +603,8 @@ class SymbolValue(TokenBase):
         return UnquotedToken(self.token)
 
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, SymbolValue):
             return False
         return self.token == other.token
@@ -555,8 +632,14 @@ class FieldInfo:
         inner_type: Actual element type (for List[T], this is T)
         is_optional: Whether field is Optional[T]
         is_list: Whether field is List[T]
-        token_name: Token name for parsing (from __token_name__ or None)
+        token_name: Token name for parsing (from __token_name__, the default
+            factory or the "token" metadata entry of primitive fields)
         position_index: Positional index in S-expression (for non-named fields)
+        is_lazy: Whether parsing is deferred until first attribute access
+        is_tuple: Whether field is an immutable Tuple[T, ...] of primitives
+        element_types: Token to class table for List[Union[...]] fields
+        is_bare: Whether a named bool is written as a bare symbol (``oval``)
+        converter: Builds the field value from its atoms (``"converter"`` metadata)
     """
 
     name: str
@@ -566,6 +649,11 @@ class FieldInfo:
     is_list: bool
     token_name: Optional[str] = None
     position_index: int = 0
+    is_lazy: bool = False
+    is_tuple: bool = False
+    element_types: Optional[Dict[str, Type[Any]]] = None
+    is_bare: bool = False
+    converter: Optional[Callable[[Tuple[Any, ...], ParseCursor], Any]] = None
 
     @property
     def can_self_parse(self) -> bool:
@@ -578,10 +666,29 @@ class NamedObject(SExpressionBase):
     """Base class for named S-expression objects.
 
     Subclasses should define __token_name__ as ClassVar[str].
+
+    Primitive fields can name their token with ``"token"`` in the field
+    metadata and are then read from ``(token VALUE)``. Named bool fields that
+    also set ``"bare": True`` are written as a bare symbol such as ``oval``.
+
+    Token-named fields with a default_factory can set ``"lazy": True`` in
+    their metadata. Their raw S-expression is kept on the instance and only
+    parsed on first attribute access, which keeps large rarely-used blocks
+    (embedded files, 3D models) out of the load path. STRICT parsing reads
+    them eagerly so that their errors are raised by from_sexpr.
+
+    Fields whose value is not a plain primitive can set ``"converter"`` in
+    their metadata. Their atoms are collected like a ``Tuple[str, ...]``
+    field and passed with the cursor to the converter, whose return value
+    becomes the field value. The class then writes the field back itself.
     """
 
+    # Parse bookkeeping set via object.__setattr__; slotted subclasses need them
+    __slots__ = ("_parsed_fields", "_lazy_sexpr", "__weakref__")
+
     __legacy_token_names__: ClassVar[List[str]] = []
     _field_info_cache: ClassVar[List[FieldInfo]]
+    _to_sexpr_code: ClassVar[Callable[[Any], SExpr]]
 
     def __post_init__(self) -> None:
         """Validate token name is defined."""
@@ -622,9 +729,23 @@ class NamedObject(SExpressionBase):
 
         # Parse fields using delegation
         field_infos = cls._classify_fields()
-        parsed_values = {}
+        parsed_values: Dict[str, Any] = {}
+        lazy_fields = {}
+        defer = cursor.strictness != ParseStrictness.STRICT
 
         for field_info in field_infos:
+            if defer and field_info.is_lazy:
+                raw_items = cls._collect_lazy_field(field_info, cursor)
+                if raw_items:
+                    lazy_fields[field_info.name] = (
+                        raw_items,
+                        cursor.strictness,
+                        cursor.path,
+                    )
+                    # Placeholder so __init__ skips the default_factory call
+                    parsed_values[field_info.name] = None
+                continue
+
             value = cls._parse_field(field_info, cursor)
             # For SymbolValue, always set the value (even if None) to prevent
             # default_factory from being called when the token is not present
@@ -634,10 +755,79 @@ class NamedObject(SExpressionBase):
                 parsed_values[field_info.name] = None
 
         instance = cls(**parsed_values)
+        parsed_fields = set(parsed_values.keys())
+
+        # Drop the placeholder defaults so __getattr__ parses on first access
+        if lazy_fields:
+            for name in lazy_fields:
+                object.__delattr__(instance, name)
+            object.__setattr__(instance, "_lazy_sexpr", lazy_fields)
+            parsed_fields.update(lazy_fields)
+
         # Track which fields were actually parsed for roundtrip fidelity
-        object.__setattr__(instance, "_parsed_fields", set(parsed_values.keys()))
+        object.__setattr__(instance, "_parsed_fields", parsed_fields)
         return instance
 
+    if not TYPE_CHECKING:
+
+        def __getattr__(self, name: str) -> Any:
+            """Parse a lazy field on first access and cache the result."""
+            lazy_fields = getattr(self, "_lazy_sexpr", None) if name[0] != "_" else None
+            if not lazy_fields or name not in lazy_fields:
+                raise AttributeError(
+                    f"'{self.__class__.__name__}' object has no attribute '{name}'"
+                )
+
+            raw_items, strictness, path = lazy_fields[name]
+            field_info = next(fi for fi in self._classify_fields() if fi.name == name)
+
+            # Re-wrap the deferred items so the regular field parser can run on them
+            container = [self.__token_name__, *raw_items]
+            cursor = ParseCursor(
+                sexpr=container,
+                parser=SExprParser(container),
+                path=path,
+                strictness=strictness,
+            )
+            try:
+                value = self._parse_field(field_info, cursor)
+            except AttributeError as e:
+                # Would otherwise be swallowed by hasattr() and getattr() defaults
+                raise ValueError(
+                    f"{cursor.get_path_str()}: Failed to parse '{name}': {e}"
+                ) from e
+            if value is None:
+                value = self.__dataclass_fields__[name].default_factory()
+
+            object.__setattr__(self, name, value)
+            # Rebind instead of mutating - shallow copies share the dict
+            object.__setattr__(
+                self,
+                "_lazy_sexpr",
+                {key: item for key, item in lazy_fields.items() if key != name},
+            )
+            return value
+
+    @classmethod
+    def _collect_lazy_field(
+        cls, field_info: FieldInfo, cursor: ParseCursor
+    ) -> List[SExpr]:
+        """Claim the raw S-expressions of a lazy field without parsing them."""
+        raw_items: List[SExpr] = []
+
+        for idx, item in enumerate(cursor.sexpr[1:], start=1):
+            if (
+                isinstance(item, list)
+                and item
+                and str(item[0]) == field_info.token_name
+            ):
+                cursor.parser.mark_used(idx)
+                raw_items.append(item)
+                if not field_info.is_list:
+                    break
+
+        return raw_items
+
     @classmethod
     def from_str(
         cls: Type[T],
@@ -655,7 +845,13 @@ class NamedObject(SExpressionBase):
         cursor: ParseCursor,
     ) -> Any:
         """Parse single field based on field metadata."""
-        if field_info.is_list:
+        if field_info.is_tuple:
+            values = cls._parse_tuple_field(field_info, cursor)
+            if values is not None and field_info.converter is not None:
+                return field_info.converter(values, cursor)
+            return values
+
+        elif field_info.is_list:
             return cls._parse_list_field(field_info, cursor)
 
         elif field_info.field_type == FieldType.PRIMITIVE:
@@ -672,16 +868,21 @@ class NamedObject(SExpressionBase):
         """Parse primitive field (named token or positional)."""
         if field_info.token_name:
             named_sexpr = cursor.find_token(field_info.token_name)
-            if len(named_sexpr) >= 2:
-                return _convert_to_type(named_sexpr[1], field_info.inner_type)
-            if not field_info.is_optional and not named_sexpr:
-                cursor.log_issue(
-                    f"{cursor.get_path_str()}: Required token '{field_info.token_name}' not found"
-                )
-            # If token not found and field is optional, return None early
             if not named_sexpr:
+                if not field_info.is_optional:
+                    cursor.log_issue(
+                        f"{cursor.get_path_str()}: Required token '{field_info.token_name}' not found"
+                    )
                 return None
 
+            # Bare flag: (token) without a value means enabled
+            if len(named_sexpr) == 1 and field_info.inner_type is bool:
+                return True
+
+            # Named primitive: (token VALUE) - value sits at index 1 of the token
+            nested_cursor = cursor.enter(named_sexpr, field_info.name)
+            return nested_cursor._parse_typed(1, field_info.name, field_info.inner_type)
+
         # Find next unused positional index
         # Start from position_index + 1 and skip already used indices
         index = field_info.position_index + 1
@@ -691,21 +892,17 @@ class NamedObject(SExpressionBase):
         inner_type = field_info.inner_type
         required = not field_info.is_optional
 
+        parser = _PRIMITIVE_PARSERS.get(inner_type)
+        if parser is not None:
+            return parser(cursor, index, field_info.name, required)
+
         try:
             if isinstance(inner_type, type) and issubclass(inner_type, Enum):
                 return cursor.parse_enum(index, field_info.name, inner_type, required)
         except TypeError:
             pass
 
-        parser_map = {
-            int: cursor.parse_int,
-            float: cursor.parse_float,
-            bool: cursor.parse_bool,
-            str: cursor.parse_str,
-        }
-
-        parser = parser_map.get(inner_type, cursor.parse_str)
-        return parser(index, field_info.name, required)
+        return cursor.parse_str(index, field_info.name, required)
 
     @classmethod
     def _parse_list_field(cls, field_info: FieldInfo, cursor: ParseCursor) -> List[Any]:
@@ -728,13 +925,21 @@ class NamedObject(SExpressionBase):
             if has_token and (not item or str(item[0]) != field_info.token_name):
                 continue
 
+            element_class: Optional[Type[Any]] = field_info.inner_type
+            if field_info.element_types is not None:
+                element_class = field_info.element_types.get(
+                    str(item[0]) if item else ""
+                )
+            if element_class is None:
+                continue
+
             # Try to parse element
             try:
                 if has_token:
                     cursor.parser.mark_used(idx)
 
                 nested_cursor = cursor.enter(item, f"{field_info.name}[{len(result)}]")
-                element = field_info.inner_type.from_sexpr(
+                element = element_class.from_sexpr(
                     item, cursor.strictness, nested_cursor
                 )
 
@@ -750,6 +955,29 @@ class NamedObject(SExpressionBase):
 
         return result
 
+    @classmethod
+    def _parse_tuple_field(
+        cls, field_info: FieldInfo, cursor: ParseCursor
+    ) -> Optional[Tuple[Any, ...]]:
+        """Parse primitive tuple field from (token A B ...) or remaining atoms."""
+        if field_info.token_name:
+            named_sexpr = cursor.find_token(field_info.token_name)
+            if not named_sexpr:
+                return None
+            atoms = named_sexpr[1:]
+        else:
+            atoms = []
+            for idx, item in enumerate(cursor.sexpr[1:], start=1):
+                if isinstance(item, list) or idx in cursor.parser.used_indices:
+                    continue
+                cursor.parser.mark_used(idx)
+                atoms.append(item)
+
+        if field_info.inner_type is str:
+            # Layer names and pad groups come from a tiny vocabulary
+            return tuple(sys.intern(str(atom)) for atom in atoms)
+        return tuple(_convert_to_type(atom, field_info.inner_type) for atom in atoms)
+
     @classmethod
     def _parse_sexpr_base_field(
         cls, field_info: FieldInfo, cursor: ParseCursor
@@ -803,8 +1031,10 @@ class NamedObject(SExpressionBase):
     @classmethod
     def _classify_fields(cls) -> List[FieldInfo]:
         """Classify all fields for parsing with caching."""
-        if hasattr(cls, "_field_info_cache"):
-            return cls._field_info_cache
+        # Look in the class's own namespace - hasattr would return a parent's cache
+        cached = cls.__dict__.get("_field_info_cache")
+        if cached is not None:
+            return cast(List[FieldInfo], cached)
 
         field_types = get_type_hints(cls)
         field_infos: List[FieldInfo] = []
@@ -818,11 +1048,18 @@ class NamedObject(SExpressionBase):
             field_info = cls._classify_field(
                 dataclass_field.name, field_type, position_index, dataclass_field
             )
+            field_info.is_lazy = (
+                bool(dataclass_field.metadata.get("lazy"))
+                and field_info.token_name is not None
+            )
             field_infos.append(field_info)
 
+            # SymbolValue and named primitives are found by token, not position
             if not (
                 field_info.field_type == FieldType.SEXPR_BASE
                 and field_info.inner_type.__name__ == "SymbolValue"
+            ) and not (
+                field_info.field_type == FieldType.PRIMITIVE and field_info.token_name
             ):
                 position_index += 1
 
@@ -852,12 +1089,55 @@ class NamedObject(SExpressionBase):
         if dataclass_field and dataclass_field.metadata.get("required") is False:
             is_optional = True
 
+        converter = (
+            dataclass_field.metadata.get("converter") if dataclass_field else None
+        )
+        if converter is not None:
+            # Converted fields collect their atoms like a Tuple[str, ...] field
+            return FieldInfo(
+                name=name,
+                field_type=FieldType.PRIMITIVE,
+                inner_type=str,
+                is_optional=True,
+                is_list=True,
+                token_name=dataclass_field.metadata.get("token"),
+                position_index=position,
+                is_tuple=True,
+                converter=converter,
+            )
+
+        if get_origin(inner_type) is tuple:
+            tuple_args = get_args(inner_type)
+            return FieldInfo(
+                name=name,
+                field_type=FieldType.PRIMITIVE,
+                inner_type=tuple_args[0] if tuple_args else str,
+                is_optional=True,
+                is_list=True,
+                token_name=(
+                    dataclass_field.metadata.get("token") if dataclass_field else None
+                ),
+                position_index=position,
+                is_tuple=True,
+            )
+
         is_list = get_origin(inner_type) in (list, List)
 
         if is_list:
             element_type = get_args(inner_type)[0] if get_args(inner_type) else Any
             token_name = None
             element_field_type = FieldType.PRIMITIVE
+            element_types: Optional[Dict[str, Type[Any]]] = None
+
+            if get_origin(element_type) is Union:
+                # Dispatch union members by token with one dict lookup per item
+                element_types = {}
+                for member in get_args(element_type):
+                    for token in [member.__token_name__] + (
+                        member.__legacy_token_names__ or []
+                    ):
+                        element_types.setdefault(token, member)
+                element_field_type = FieldType.SEXPR_BASE
 
             try:
                 # Type guard to ensure element_type is a proper type before issubclass check
@@ -879,6 +1159,7 @@ class NamedObject(SExpressionBase):
                 is_list=True,
                 token_name=token_name,
                 position_index=position,
+                element_types=element_types,
             )
 
         try:
@@ -908,45 +1189,109 @@ class NamedObject(SExpressionBase):
         except TypeError:
             pass
 
+        # Primitives are positional unless the field metadata names a token
+        metadata = dataclass_field.metadata if dataclass_field else {}
+        token_name = metadata.get("token")
+
         return FieldInfo(
             name=name,
             field_type=FieldType.PRIMITIVE,
             inner_type=inner_type,
             is_optional=is_optional,
             is_list=False,
-            token_name=None,
+            token_name=token_name,
             position_index=position,
+            is_bare=bool(metadata.get("bare")) and token_name is not None,
         )
 
     def to_sexpr(self) -> SExpr:
         """Serialize to S-expression."""
-        result: SExpr = [self.__token_name__]
-        parsed_fields = getattr(self, "_parsed_fields", None)
-
-        for field_info in self._classify_fields():
-            value = getattr(self, field_info.name)
+        serialize = type(self).__dict__.get("_to_sexpr_code")
+        if serialize is None:
+            serialize = type(self)._compile_to_sexpr()
+        return serialize(self)
 
-            if value is None:
-                continue
+    @classmethod
+    def _compile_to_sexpr(cls) -> Callable[[Any], SExpr]:
+        """Generate a serializer specialized to this class's fields.
 
+        The field list is fixed per class, so instead of walking it and
+        dispatching per field on every call, the per-field branches are
+        written out once as Python source with direct attribute access and
+        inlined emit logic, compiled and cached on the class.
+        """
+        namespace: Dict[str, Any] = {
+            "Enum": Enum,
+            "SExpressionBase": SExpressionBase,
+            "UnquotedToken": UnquotedToken,
+            "emit_value": _emit_value,
+            "SCALARS": frozenset((str, int, float, bool)),
+            "TOKEN": cls.__token_name__,
+        }
+        lines = [
+            "def to_sexpr(self):",
+            "    result = [TOKEN]",
+            "    append = result.append",
             # For parsed objects, only include fields that were in the original data
-            if parsed_fields is not None and field_info.name not in parsed_fields:
-                continue
-
-            if isinstance(value, SExpressionBase):
-                result.append(value.to_sexpr())
-            elif isinstance(value, list):
-                for item in value:
-                    if isinstance(item, SExpressionBase):
-                        result.append(item.to_sexpr())
-                    else:
-                        result.append(item)
-            elif isinstance(value, Enum):
-                result.append(value.value)
+            "    parsed = getattr(self, '_parsed_fields', None)",
+        ]
+        for index, field_info in enumerate(cls._classify_fields()):
+            token = f"T{index}"
+            if field_info.is_bare:
+                namespace[token] = UnquotedToken(field_info.token_name)
+                emit = ["if value:", f"    append({token})"]
+            elif field_info.token_name and field_info.is_tuple:
+                namespace[token] = field_info.token_name
+                emit = ["if value:", f"    append([{token}, *value])"]
+            elif field_info.token_name and field_info.field_type == FieldType.PRIMITIVE:
+                namespace[token] = field_info.token_name
+                # Enum values are KiCad keywords and must not be quoted
+                emit = [
+                    "if isinstance(value, Enum):",
+                    "    value = value.value",
+                    "    if type(value) is str:",
+                    "        value = UnquotedToken(value)",
+                    f"append([{token}, value])",
+                ]
+            elif field_info.is_list:
+                emit = [
+                    "if type(value) is list:",
+                    "    for item in value:",
+                    "        append(item.to_sexpr() "
+                    "if isinstance(item, SExpressionBase) else item)",
+                    "else:",
+                    "    emit_value(result, value)",
+                ]
+            elif field_info.field_type == FieldType.SEXPR_BASE:
+                # Exact type check first; isinstance goes through ABCMeta
+                namespace[f"C{index}"] = field_info.inner_type
+                emit = [
+                    f"if type(value) is C{index} or "
+                    "isinstance(value, SExpressionBase):",
+                    "    append(value.to_sexpr())",
+                    "else:",
+                    "    emit_value(result, value)",
+                ]
             else:
-                result.append(value)
-
-        return result
+                emit = [
+                    "if type(value) in SCALARS:",
+                    "    append(value)",
+                    "else:",
+                    "    emit_value(result, value)",
+                ]
+
+            name = field_info.name
+            lines.append(f"    if parsed is None or {name!r} in parsed:")
+            lines.append(f"        value = self.{name}")
+            lines.append("        if value is not None:")
+            lines.extend(f"            {line}" for line in emit)
+        lines.append("    return result")
+
+        code = compile("\n".join(lines), f"<{cls.__qualname__}.to_sexpr>", "exec")
+        exec(code, namespace)
+        serialize = cast(Callable[[Any], SExpr], namespace["to_sexpr"])
+        cls._to_sexpr_code = serialize
+        return serialize
 
     def to_sexpr_str(self, _indent_level: int = 0) -> str:
         """Convert to KiCad-formatted S-expression string.
@@ -960,19 +1305,40 @@ class NamedObject(SExpressionBase):
         sexpr = self.to_sexpr()
         return self._format_sexpr_kicad_style(sexpr, _indent_level)
 
+    def write_sexpr(self, fp: IO[str]) -> None:
+        """Write KiCad-formatted S-expression to a text stream.
+
+        Produces the same output as to_sexpr_str() but hands it to the stream
+        chunk by chunk, so the complete file content is never held in memory
+        as one string.
+
+        Args:
+            fp: Writable text stream (e.g. a file opened in text mode)
+        """
+        fp.writelines(self._iter_sexpr_kicad_style(self.to_sexpr()))
+
     def _format_sexpr_kicad_style(self, sexpr: Any, indent_level: int = 0) -> str:
         """Format S-expression in KiCad style with tabs and unquoted tokens."""
+        return "".join(self._iter_sexpr_kicad_style(sexpr, indent_level))
+
+    def _iter_sexpr_kicad_style(
+        self, sexpr: Any, indent_level: int = 0
+    ) -> Iterator[str]:
+        """Yield the KiCad-style formatted S-expression in chunks."""
         if not isinstance(sexpr, list):
-            return self._format_primitive_value(sexpr)
+            yield self._format_primitive_value(sexpr)
+            return
 
         if not sexpr:
-            return "()"
+            yield "()"
+            return
 
         current_indent = "\t" * indent_level
         token_name = str(sexpr[0])
 
         if len(sexpr) == 1:
-            return f"{current_indent}({token_name})"
+            yield f"{current_indent}({token_name})"
+            return
 
         # Separate primitives and nested lists
         primitive_values = []
@@ -987,20 +1353,18 @@ class NamedObject(SExpressionBase):
         # Check for single line format: only primitives and short enough
         if not nested_lists and len(sexpr) <= 4:
             all_items = [token_name] + primitive_values
-            return f"{current_indent}({' '.join(all_items)})"
+            yield f"{current_indent}({' '.join(all_items)})"
+            return
 
         # Multi-line format: primitives on first line, nested lists indented
         primitive_part = f" {' '.join(primitive_values)}" if primitive_values else ""
-        lines = [f"{current_indent}({token_name}{primitive_part}"]
+        yield f"{current_indent}({token_name}{primitive_part}"
 
         for nested_item in nested_lists:
-            nested_formatted = self._format_sexpr_kicad_style(
-                nested_item, indent_level + 1
-            )
-            lines.append(nested_formatted)
+            yield "\n"
+            yield from self._iter_sexpr_kicad_style(nested_item, indent_level + 1)
 
-        lines.append(f"{current_indent})")
-        return "\n".join(lines)
+        yield f"\n{current_indent})"
 
     def _format_primitive_value(self, value: Any) -> str:
         """Format primitive values for S-expression serialization."""
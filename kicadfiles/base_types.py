@@ -143,7 +143,7 @@ class AtXY(NamedObject):
         return self
 
 
-@dataclass
+@dataclass(slots=True)
 class At(NamedObject):
     """Position identifier token that defines positional coordinates and rotation of an object.
 
@@ -1,6 +1,6 @@
 """Common enumeration types for KiCad S-expressions."""
 
-from enum import Enum
+from enum import Enum, IntFlag
 
 
 class PinElectricalType(Enum):
@@ -43,6 +43,15 @@ class PadType(Enum):
     NP_THRU_HOLE = "np_thru_hole"
 
 
+class ChamferCorner(IntFlag):
+    """Chamfered pad corners as bit flags."""
+
+    TOP_LEFT = 1
+    TOP_RIGHT = 2
+    BOTTOM_LEFT = 4
+    BOTTOM_RIGHT = 8
+
+
 class PadShape(Enum):
     """Pad shapes for footprints."""
 
@@ -54,6 +63,18 @@ class PadShape(Enum):
     CUSTOM = "custom"
 
 
+class PadProperty(Enum):
+    """Fabrication properties for pads."""
+
+    BGA = "pad_prop_bga"
+    FIDUCIAL_GLOBAL = "pad_prop_fiducial_glob"
+    FIDUCIAL_LOCAL = "pad_prop_fiducial_loc"
+    TESTPOINT = "pad_prop_testpoint"
+    HEATSINK = "pad_prop_heatsink"
+    CASTELLATED = "pad_prop_castellated"
+    MECHANICAL = "pad_prop_mechanical"
+
+
 class StrokeType(Enum):
     """Valid stroke line styles for graphics."""
 
@@ -1,7 +1,8 @@
 """Footprint library elements for KiCad S-expressions - footprint management and properties."""
 
+import os
 from dataclasses import dataclass, field
-from typing import ClassVar, List, Optional, Union
+from typing import ClassVar, List, Optional, Tuple, Union
 
 from .advanced_graphics import FpArc, FpCircle, FpCurve, FpLine, FpPoly, FpRect, FpText
 from .base_element import (
@@ -15,6 +16,8 @@ from .base_element import (
 from .base_types import At, Layer, Property, Uuid, Xyz
 from .pad_and_drill import Pad
 
+_KICAD_MOD_EXT = ".kicad_mod"
+
 
 @dataclass
 class FileData(NamedObject):
@@ -52,29 +55,33 @@ class EmbeddedFile(NamedObject):
         )
 
     Args:
-        name: File name token
-        type: File type token
+        name: File name
+        type: File type
         data: Base64 encoded file data token (optional)
-        checksum: File checksum token (optional)
+        checksum: File checksum (optional)
     """
 
     __token_name__: ClassVar[str] = "file"
 
-    name: NamedString = field(
-        default_factory=lambda: NamedString("name", ""),
-        metadata={"description": "File name token"},
+    name: str = field(
+        default="",
+        metadata={"token": "name", "description": "File name"},
     )
-    type: NamedString = field(
-        default_factory=lambda: NamedString("type", ""),
-        metadata={"description": "File type token"},
+    type: str = field(
+        default="",
+        metadata={"token": "type", "description": "File type"},
     )
     data: FileData = field(
         default_factory=lambda: FileData(),
         metadata={"description": "Base64 encoded file data token", "required": False},
     )
-    checksum: NamedString = field(
-        default_factory=lambda: NamedString("checksum", ""),
-        metadata={"description": "File checksum token", "required": False},
+    checksum: Optional[str] = field(
+        default=None,
+        metadata={
+            "token": "checksum",
+            "description": "File checksum",
+            "required": False,
+        },
     )
 
 
@@ -165,13 +172,13 @@ class NetTiePadGroups(NamedObject):
         (net_tie_pad_groups "PAD_LIST" "PAD_LIST" ...)
 
     Args:
-        groups: List of pad group strings
+        groups: Pad group strings
     """
 
     __token_name__: ClassVar[str] = "net_tie_pad_groups"
 
-    groups: List[str] = field(
-        default_factory=list, metadata={"description": "List of pad group strings"}
+    groups: Tuple[str, ...] = field(
+        default_factory=tuple, metadata={"description": "Pad group strings"}
     )
 
 
@@ -189,7 +196,7 @@ class ModelAt(NamedObject):
     __token_name__: ClassVar[str] = "at"
 
     xyz: Xyz = field(
-        default_factory=lambda: Xyz(),
+        default_factory=Xyz,
         metadata={"description": "3D coordinates for model position"},
     )
 
@@ -227,7 +234,7 @@ class ModelRotate(NamedObject):
     __token_name__: ClassVar[str] = "rotate"
 
     xyz: Xyz = field(
-        default_factory=lambda: Xyz(),
+        default_factory=Xyz,
         metadata={"description": "3D rotation angles for model"},
     )
 
@@ -246,7 +253,7 @@ class ModelOffset(NamedObject):
     __token_name__: ClassVar[str] = "offset"
 
     xyz: Xyz = field(
-        default_factory=lambda: Xyz(),
+        default_factory=Xyz,
         metadata={"description": "3D offset coordinates for model"},
     )
 
@@ -279,28 +286,28 @@ class Model(NamedObject):
         default="", metadata={"description": "Path and file name of the 3D model"}
     )
     at: ModelAt = field(
-        default_factory=lambda: ModelAt(),
+        default_factory=ModelAt,
         metadata={
             "description": "3D position coordinates relative to the footprint",
             "required": False,
         },
     )
     scale: ModelScale = field(
-        default_factory=lambda: ModelScale(),
+        default_factory=ModelScale,
         metadata={
             "description": "Model scale factor for each 3D axis",
             "required": False,
         },
     )
     rotate: ModelRotate = field(
-        default_factory=lambda: ModelRotate(),
+        default_factory=ModelRotate,
         metadata={
             "description": "Model rotation for each 3D axis relative to the footprint",
             "required": False,
         },
     )
     offset: ModelOffset = field(
-        default_factory=lambda: ModelOffset(),
+        default_factory=ModelOffset,
         metadata={"description": "Model offset coordinates", "required": False},
     )
     hide: TokenFlag = field(
@@ -374,7 +381,7 @@ class Footprint(NamedObject):
         zone_connect: How pads connect to filled zones (optional)
         thermal_width: Thermal relief spoke width (optional)
         thermal_gap: Distance from pad to zone for thermal relief (optional)
-        private_layers: List of private layers (optional)
+        private_layers: Private layer names (optional)
         net_tie_pad_groups: Net tie pad groups (optional)
         pads: List of pads (optional)
         models: List of 3D models (optional)
@@ -472,6 +479,7 @@ class Footprint(NamedObject):
     autoplace_cost90: Optional[int] = field(
         default=None,
         metadata={
+            "token": "autoplace_cost90",
             "description": "Vertical cost for automatic placement",
             "required": False,
         },
@@ -479,17 +487,26 @@ class Footprint(NamedObject):
     autoplace_cost180: Optional[int] = field(
         default=None,
         metadata={
+            "token": "autoplace_cost180",
             "description": "Horizontal cost for automatic placement",
             "required": False,
         },
     )
     solder_mask_margin: Optional[float] = field(
         default=None,
-        metadata={"description": "Solder mask distance from pads", "required": False},
+        metadata={
+            "token": "solder_mask_margin",
+            "description": "Solder mask distance from pads",
+            "required": False,
+        },
     )
     solder_paste_margin: Optional[float] = field(
         default=None,
-        metadata={"description": "Solder paste distance from pads", "required": False},
+        metadata={
+            "token": "solder_paste_margin",
+            "description": "Solder paste distance from pads",
+            "required": False,
+        },
     )
     solder_paste_margin_ratio: NamedFloat = field(
         default_factory=lambda: NamedFloat("solder_paste_margin_ratio", 0.0),
@@ -498,6 +515,7 @@ class Footprint(NamedObject):
     solder_paste_ratio: Optional[float] = field(
         default=None,
         metadata={
+            "token": "solder_paste_ratio",
             "description": "Percentage of pad size for solder paste",
             "required": False,
         },
@@ -511,7 +529,11 @@ class Footprint(NamedObject):
     )
     zone_connect: Optional[int] = field(
         default=None,
-        metadata={"description": "How pads connect to filled zones", "required": False},
+        metadata={
+            "token": "zone_connect",
+            "description": "How pads connect to filled zones",
+            "required": False,
+        },
     )
     thermal_width: NamedFloat = field(
         default_factory=lambda: NamedFloat("thermal_width", 0.0),
@@ -524,9 +546,13 @@ class Footprint(NamedObject):
             "required": False,
         },
     )
-    private_layers: Optional[List[str]] = field(
-        default_factory=list,
-        metadata={"description": "List of private layers", "required": False},
+    private_layers: Tuple[str, ...] = field(
+        default_factory=tuple,
+        metadata={
+            "token": "private_layers",
+            "description": "Private layer names",
+            "required": False,
+        },
     )
     net_tie_pad_groups: NetTiePadGroups = field(
         default_factory=lambda: NetTiePadGroups(),
@@ -538,7 +564,7 @@ class Footprint(NamedObject):
     )
     models: Optional[List[Model]] = field(
         default_factory=list,
-        metadata={"description": "List of 3D models", "required": False},
+        metadata={"description": "List of 3D models", "required": False, "lazy": True},
     )
     fp_elements: Optional[
         List[Union[FpArc, FpCircle, FpCurve, FpLine, FpPoly, FpRect, FpText]]
@@ -555,7 +581,11 @@ class Footprint(NamedObject):
     )
     embedded_files: EmbeddedFiles = field(
         default_factory=lambda: EmbeddedFiles(),
-        metadata={"description": "Embedded files container", "required": False},
+        metadata={
+            "description": "Embedded files container",
+            "required": False,
+            "lazy": True,
+        },
     )
 
     @classmethod
@@ -566,7 +596,7 @@ class Footprint(NamedObject):
         encoding: str = "utf-8",
     ) -> "Footprint":
         """Parse from S-expression file - convenience method for footprint operations."""
-        if not file_path.endswith(".kicad_mod"):
+        if os.path.splitext(file_path)[1].lower() != _KICAD_MOD_EXT:
             raise ValueError("Unsupported file extension. Expected: .kicad_mod")
         with open(file_path, "r", encoding=encoding) as f:
             content = f.read()
@@ -579,11 +609,10 @@ class Footprint(NamedObject):
             file_path: Path to write the .kicad_mod file
             encoding: File encoding (default: utf-8)
         """
-        if not file_path.endswith(".kicad_mod"):
+        if os.path.splitext(file_path)[1].lower() != _KICAD_MOD_EXT:
             raise ValueError("Unsupported file extension. Expected: .kicad_mod")
-        content = self.to_sexpr_str()
         with open(file_path, "w", encoding=encoding) as f:
-            f.write(content)
+            self.write_sexpr(f)
 
 
 @dataclass
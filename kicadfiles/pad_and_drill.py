@@ -1,21 +1,49 @@
 """Pad and drill related elements for KiCad S-expressions."""
 
+from __future__ import annotations
+
+import math
+import sys
+from array import array
 from dataclasses import dataclass, field
-from typing import ClassVar, List, Optional, Union
+from typing import Any, ClassVar, Dict, List, Optional, Tuple, Union
 
 from .advanced_graphics import GrArc, GrCircle, GrCurve, GrLine, GrPoly, GrRect
 from .base_element import (
     NamedFloat,
     NamedObject,
     NamedString,
-    SymbolValue,
-    TokenFlag,
+    ParseCursor,
+    ParseStrictness,
+    UnquotedToken,
 )
 from .base_types import Anchor, At, Layers, Offset, Size, Uuid
-from .enums import PadShape, PadType, ZoneConnection
+from .enums import ChamferCorner, PadProperty, PadShape, PadType, ZoneConnection
+from .sexpr_parser import SExpr
+
+# KiCad corner names -> ChamferCorner bits
+_CHAMFER_CORNERS = {
+    "top_left": ChamferCorner.TOP_LEFT,
+    "top_right": ChamferCorner.TOP_RIGHT,
+    "bottom_left": ChamferCorner.BOTTOM_LEFT,
+    "bottom_right": ChamferCorner.BOTTOM_RIGHT,
+}
+
+# Optional Pad float fields kept as NaN-filled columns by PadsSoA; each
+# field name is also its S-expression token
+_PAD_OPTIONAL_FLOATS = (
+    "chamfer_ratio",
+    "die_length",
+    "solder_mask_margin",
+    "solder_paste_margin",
+    "solder_paste_margin_ratio",
+    "clearance",
+    "thermal_width",
+    "thermal_gap",
+)
 
 
-@dataclass
+@dataclass(slots=True)
 class Teardrops(NamedObject):
     """Teardrops definition token for pads.
 
@@ -47,45 +75,83 @@ class Teardrops(NamedObject):
 
     __token_name__: ClassVar[str] = "teardrops"
 
-    best_length_ratio: NamedFloat = field(
-        default_factory=lambda: NamedFloat("best_length_ratio", 0.0),
-        metadata={"description": "Best length ratio setting"},
+    best_length_ratio: float = field(
+        default=0.0,
+        metadata={
+            "token": "best_length_ratio",
+            "description": "Best length ratio setting",
+        },
     )
-    max_length: NamedFloat = field(
-        default_factory=lambda: NamedFloat("max_length", 0.0),
-        metadata={"description": "Maximum length setting"},
+    max_length: float = field(
+        default=0.0,
+        metadata={"token": "max_length", "description": "Maximum length setting"},
     )
-    best_width_ratio: NamedFloat = field(
-        default_factory=lambda: NamedFloat("best_width_ratio", 0.0),
-        metadata={"description": "Best width ratio setting"},
+    best_width_ratio: float = field(
+        default=0.0,
+        metadata={
+            "token": "best_width_ratio",
+            "description": "Best width ratio setting",
+        },
     )
-    max_width: NamedFloat = field(
-        default_factory=lambda: NamedFloat("max_width", 0.0),
-        metadata={"description": "Maximum width setting"},
+    max_width: float = field(
+        default=0.0,
+        metadata={"token": "max_width", "description": "Maximum width setting"},
     )
-    curved_edges: TokenFlag = field(
-        default_factory=lambda: TokenFlag("curved_edges"),
-        metadata={"description": "Curved edges setting", "required": False},
+    curved_edges: Optional[bool] = field(
+        default=None,
+        metadata={
+            "token": "curved_edges",
+            "description": "Curved edges setting",
+            "required": False,
+        },
     )
-    filter_ratio: NamedFloat = field(
-        default_factory=lambda: NamedFloat("filter_ratio", 0.0),
-        metadata={"description": "Filter ratio setting"},
+    filter_ratio: float = field(
+        default=0.0,
+        metadata={"token": "filter_ratio", "description": "Filter ratio setting"},
     )
-    enabled: TokenFlag = field(
-        default_factory=lambda: TokenFlag("enabled"),
-        metadata={"description": "Enabled setting", "required": False},
+    enabled: Optional[bool] = field(
+        default=None,
+        metadata={
+            "token": "enabled",
+            "description": "Enabled setting",
+            "required": False,
+        },
     )
-    allow_two_segments: TokenFlag = field(
-        default_factory=lambda: TokenFlag("allow_two_segments"),
-        metadata={"description": "Allow two segments setting", "required": False},
+    allow_two_segments: Optional[bool] = field(
+        default=None,
+        metadata={
+            "token": "allow_two_segments",
+            "description": "Allow two segments setting",
+            "required": False,
+        },
     )
-    prefer_zone_connections: TokenFlag = field(
-        default_factory=lambda: TokenFlag("prefer_zone_connections"),
-        metadata={"description": "Prefer zone connections setting", "required": False},
+    prefer_zone_connections: Optional[bool] = field(
+        default=None,
+        metadata={
+            "token": "prefer_zone_connections",
+            "description": "Prefer zone connections setting",
+            "required": False,
+        },
     )
 
 
-@dataclass
+def _parse_chamfer_corners(
+    names: Tuple[str, ...], cursor: ParseCursor
+) -> ChamferCorner:
+    """Combine KiCad corner names into a ChamferCorner mask."""
+    corners = ChamferCorner(0)
+    for name in names:
+        corner = _CHAMFER_CORNERS.get(name)
+        if corner is None:
+            cursor.log_issue(
+                f"{cursor.get_path_str()}: Unknown chamfer corner '{name}'"
+            )
+            continue
+        corners |= corner
+    return corners
+
+
+@dataclass(slots=True)
 class Chamfer(NamedObject):
     """Chamfer corner definition token for pads.
 
@@ -94,19 +160,37 @@ class Chamfer(NamedObject):
         (chamfer CORNER_LIST)
 
     Valid chamfer corner attributes are top_left, top_right, bottom_left, and bottom_right.
+    They are stored as ChamferCorner bit flags.
 
     Args:
-        corners: List of corners to chamfer
+        corners: Chamfered corners
     """
 
     __token_name__: ClassVar[str] = "chamfer"
 
-    corners: List[str] = field(
-        default_factory=list, metadata={"description": "List of corners to chamfer"}
+    corners: ChamferCorner = field(
+        default=ChamferCorner(0),
+        metadata={
+            "description": "Chamfered corners",
+            "converter": _parse_chamfer_corners,
+        },
     )
 
+    @property
+    def corner_names(self) -> List[str]:
+        """KiCad names of the chamfered corners."""
+        return [
+            name for name, corner in _CHAMFER_CORNERS.items() if corner in self.corners
+        ]
+
+    def to_sexpr(self) -> SExpr:
+        """Serialize set corner bits as unquoted corner names."""
+        return [self.__token_name__] + [
+            UnquotedToken(name) for name in self.corner_names
+        ]
 
-@dataclass
+
+@dataclass(slots=True)
 class Options(NamedObject):
     """Custom pad options definition token.
 
@@ -135,12 +219,12 @@ class Options(NamedObject):
         },
     )
     anchor: Anchor = field(
-        default_factory=lambda: Anchor(),
+        default_factory=Anchor,
         metadata={"description": "Anchor pad shape", "required": False},
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class Shape(NamedObject):
     """Pad shape definition token.
 
@@ -161,7 +245,7 @@ class Shape(NamedObject):
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class ZoneConnect(NamedObject):
     """Zone connection definition token.
 
@@ -186,7 +270,7 @@ class ZoneConnect(NamedObject):
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class Net(NamedObject):
     """Net connection definition token.
 
@@ -204,8 +288,15 @@ class Net(NamedObject):
     number: int = field(default=0, metadata={"description": "Net number"})
     name: str = field(default="", metadata={"description": "Net name"})
 
+    def __post_init__(self) -> None:
+        """Intern the net name, which repeats across every pad on the net."""
+        # Explicit base call: zero-argument super() fails in slotted dataclasses
+        NamedObject.__post_init__(self)
+        if isinstance(self.name, str):
+            self.name = sys.intern(self.name)
+
 
-@dataclass
+@dataclass(slots=True)
 class Drill(NamedObject):
     """Drill definition token for pads.
 
@@ -227,9 +318,11 @@ class Drill(NamedObject):
 
     __token_name__: ClassVar[str] = "drill"
 
-    oval: Optional[SymbolValue] = field(
-        default_factory=lambda: SymbolValue(token="oval"),
+    oval: Optional[bool] = field(
+        default=None,
         metadata={
+            "token": "oval",
+            "bare": True,
             "description": "Whether the drill is oval instead of round",
             "required": False,
         },
@@ -258,7 +351,7 @@ class Drill(NamedObject):
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class Primitives(NamedObject):
     """Custom pad primitives definition token.
 
@@ -295,16 +388,33 @@ class Primitives(NamedObject):
         default_factory=lambda: NamedFloat("width", 0.0),
         metadata={"description": "Line width of graphical items", "required": False},
     )
-    fill: TokenFlag = field(
-        default_factory=lambda: TokenFlag("fill"),
+    fill: Optional[bool] = field(
+        default=None,
         metadata={
+            "token": "fill",
             "description": "Whether geometry should be filled",
             "required": False,
         },
     )
 
 
-@dataclass
+# Child tokens a "simple" pad may carry to take Pad's fast parse path
+_SIMPLE_PAD_CHILDREN: Dict[str, Any] = {
+    "at": At,
+    "size": Size,
+    "layers": Layers,
+    "roundrect_rratio": NamedFloat,
+    "net": Net,
+    "pinfunction": str,
+    "pintype": str,
+    "uuid": Uuid,
+}
+_SIMPLE_PAD_REQUIRED = frozenset(("at", "size", "layers"))
+_PAD_TYPES = {pad_type.value: pad_type for pad_type in PadType}
+_PAD_SHAPES = {pad_shape.value: pad_shape for pad_shape in PadShape}
+
+
+@dataclass(slots=True)
 class Pad(NamedObject):
     """Footprint pad definition token.
 
@@ -363,111 +473,263 @@ class Pad(NamedObject):
         metadata={"description": "Pad shape"},
     )
     at: At = field(
-        default_factory=lambda: At(),
+        default_factory=At,
         metadata={"description": "Position and rotation"},
     )
-    size: Size = field(
-        default_factory=lambda: Size(), metadata={"description": "Pad dimensions"}
-    )
+    size: Size = field(default_factory=Size, metadata={"description": "Pad dimensions"})
     layers: Layers = field(
-        default_factory=lambda: Layers(),
+        default_factory=Layers,
         metadata={"description": "Layer list"},
     )
     drill: Drill = field(
-        default_factory=lambda: Drill(),
+        default_factory=Drill,
         metadata={"description": "Drill definition", "required": False},
     )
-    property: Optional[str] = field(
-        default=None, metadata={"description": "Pad property", "required": False}
+    property: Optional[PadProperty] = field(
+        default=None,
+        metadata={
+            "token": "property",
+            "description": "Pad property",
+            "required": False,
+        },
     )
-    locked: TokenFlag = field(
-        default_factory=lambda: TokenFlag("locked"),
-        metadata={"description": "Whether pad is locked", "required": False},
+    locked: Optional[bool] = field(
+        default=None,
+        metadata={
+            "token": "locked",
+            "description": "Whether pad is locked",
+            "required": False,
+        },
     )
-    remove_unused_layer: TokenFlag = field(
-        default_factory=lambda: TokenFlag("remove_unused_layer"),
-        metadata={"description": "Remove unused layers flag", "required": False},
+    remove_unused_layer: Optional[bool] = field(
+        default=None,
+        metadata={
+            "token": "remove_unused_layer",
+            "description": "Remove unused layers flag",
+            "required": False,
+        },
     )
-    remove_unused_layers: TokenFlag = field(
-        default_factory=lambda: TokenFlag("remove_unused_layers"),
+    remove_unused_layers: Optional[bool] = field(
+        default=None,
         metadata={
+            "token": "remove_unused_layers",
             "description": "Remove unused layers flag (newer format)",
             "required": False,
         },
     )
-    keep_end_layers: TokenFlag = field(
-        default_factory=lambda: TokenFlag("keep_end_layers"),
-        metadata={"description": "Keep end layers flag", "required": False},
+    keep_end_layers: Optional[bool] = field(
+        default=None,
+        metadata={
+            "token": "keep_end_layers",
+            "description": "Keep end layers flag",
+            "required": False,
+        },
     )
     roundrect_rratio: NamedFloat = field(
         default_factory=lambda: NamedFloat("roundrect_rratio", 0.0),
         metadata={"description": "Round rectangle corner ratio", "required": False},
     )
     chamfer_ratio: Optional[float] = field(
-        default=None, metadata={"description": "Chamfer ratio", "required": False}
+        default=None,
+        metadata={
+            "token": "chamfer_ratio",
+            "description": "Chamfer ratio",
+            "required": False,
+        },
     )
-    chamfer: Optional[List[str]] = field(
-        default_factory=list,
+    chamfer: Optional[Chamfer] = field(
+        default=None,
         metadata={"description": "Chamfer corners", "required": False},
     )
     net: Net = field(
-        default_factory=lambda: Net(),
+        default_factory=Net,
         metadata={"description": "Net connection", "required": False},
     )
     uuid: Optional[Uuid] = field(
         default=None, metadata={"description": "Unique identifier", "required": False}
     )
     pinfunction: Optional[str] = field(
-        default=None, metadata={"description": "Pin function name", "required": False}
+        default=None,
+        metadata={
+            "token": "pinfunction",
+            "description": "Pin function name",
+            "required": False,
+        },
     )
     pintype: Optional[str] = field(
-        default=None, metadata={"description": "Pin type", "required": False}
+        default=None,
+        metadata={"token": "pintype", "description": "Pin type", "required": False},
     )
     die_length: Optional[float] = field(
-        default=None, metadata={"description": "Die length", "required": False}
+        default=None,
+        metadata={
+            "token": "die_length",
+            "description": "Die length",
+            "required": False,
+        },
     )
     solder_mask_margin: Optional[float] = field(
-        default=None, metadata={"description": "Solder mask margin", "required": False}
+        default=None,
+        metadata={
+            "token": "solder_mask_margin",
+            "description": "Solder mask margin",
+            "required": False,
+        },
     )
     solder_paste_margin: Optional[float] = field(
-        default=None, metadata={"description": "Solder paste margin", "required": False}
+        default=None,
+        metadata={
+            "token": "solder_paste_margin",
+            "description": "Solder paste margin",
+            "required": False,
+        },
     )
     solder_paste_margin_ratio: Optional[float] = field(
         default=None,
-        metadata={"description": "Solder paste margin ratio", "required": False},
+        metadata={
+            "token": "solder_paste_margin_ratio",
+            "description": "Solder paste margin ratio",
+            "required": False,
+        },
     )
     clearance: Optional[float] = field(
-        default=None, metadata={"description": "Clearance value", "required": False}
+        default=None,
+        metadata={
+            "token": "clearance",
+            "description": "Clearance value",
+            "required": False,
+        },
     )
     zone_connect: Optional[ZoneConnection] = field(
         default=None,
-        metadata={"description": "Zone connection type", "required": False},
+        metadata={
+            "token": "zone_connect",
+            "description": "Zone connection type",
+            "required": False,
+        },
     )
     thermal_width: Optional[float] = field(
-        default=None, metadata={"description": "Thermal width", "required": False}
+        default=None,
+        metadata={
+            "token": "thermal_width",
+            "description": "Thermal width",
+            "required": False,
+        },
     )
     thermal_bridge_width: NamedFloat = field(
         default_factory=lambda: NamedFloat("thermal_bridge_width", 0.0),
         metadata={"description": "Thermal bridge width", "required": False},
     )
     thermal_gap: Optional[float] = field(
-        default=None, metadata={"description": "Thermal gap", "required": False}
+        default=None,
+        metadata={
+            "token": "thermal_gap",
+            "description": "Thermal gap",
+            "required": False,
+        },
     )
     options: Options = field(
-        default_factory=lambda: Options(),
-        metadata={"description": "Custom pad options", "required": False},
+        default_factory=Options,
+        metadata={"description": "Custom pad options", "required": False, "lazy": True},
     )
     primitives: Primitives = field(
-        default_factory=lambda: Primitives(),
-        metadata={"description": "Custom pad primitives", "required": False},
+        default_factory=Primitives,
+        metadata={
+            "description": "Custom pad primitives",
+            "required": False,
+            "lazy": True,
+        },
     )
     teardrops: Teardrops = field(
-        default_factory=lambda: Teardrops(),
-        metadata={"description": "Teardrop settings", "required": False},
-    )
-
-
-@dataclass
+        default_factory=Teardrops,
+        metadata={"description": "Teardrop settings", "required": False, "lazy": True},
+    )
+
+    @classmethod
+    def from_sexpr(
+        cls,
+        sexpr: Union[str, SExpr],
+        strictness: ParseStrictness = ParseStrictness.STRICT,
+        cursor: Optional[ParseCursor] = None,
+    ) -> Pad:
+        """Parse a pad, taking a shortcut for simple pads.
+
+        Most pads carry only a number, type, shape, (at), (size), (layers)
+        and maybe (roundrect_rratio), (net), (pinfunction), (pintype) and
+        (uuid). Such pads nested in
+        a parent are built directly from their children instead of probing
+        every optional field; anything else uses the generic parser.
+
+        Args:
+            sexpr: Pad S-expression
+            strictness: Parse strictness
+            cursor: Cursor of the pad inside its parent (optional)
+
+        Returns:
+            Parsed pad
+        """
+        if cursor is not None:
+            pad = cls._from_simple_sexpr(cursor)
+            if pad is not None:
+                return pad
+        # Explicit two-argument super(): the slotted class is recreated
+        return super(Pad, cls).from_sexpr(sexpr, strictness, cursor)
+
+    @classmethod
+    def _from_simple_sexpr(cls, cursor: ParseCursor) -> Optional[Pad]:
+        """Build a simple pad directly, or return None to use the generic path."""
+        sexpr = cursor.sexpr
+        if len(sexpr) < 7 or str(sexpr[0]) != cls.__token_name__:
+            return None
+        pad_type = _PAD_TYPES.get(str(sexpr[2]))
+        pad_shape = _PAD_SHAPES.get(str(sexpr[3]))
+        if pad_type is None or pad_shape is None or isinstance(sexpr[1], list):
+            return None
+
+        children: Dict[str, SExpr] = {}
+        for item in sexpr[4:]:
+            if not isinstance(item, list) or not item:
+                return None
+            token = str(item[0])
+            if token not in _SIMPLE_PAD_CHILDREN or token in children:
+                return None
+            children[token] = item
+        if not _SIMPLE_PAD_REQUIRED.issubset(children):
+            return None
+
+        values: Dict[str, Any] = {
+            "number": str(sexpr[1]),
+            "type": pad_type,
+            "shape": pad_shape,
+        }
+        for token, item in children.items():
+            child_type = _SIMPLE_PAD_CHILDREN[token]
+            nested_cursor = cursor.enter(item, token)
+            if child_type is str:
+                value = nested_cursor._parse_typed(1, token, str)
+            else:
+                value = child_type.from_sexpr(item, cursor.strictness, nested_cursor)
+            if value is not None:
+                values[token] = value
+
+        pad = cls(**values)
+        object.__setattr__(pad, "_parsed_fields", set(values))
+        return pad
+
+    def __post_init__(self) -> None:
+        """Intern pad strings drawn from a small board-wide vocabulary."""
+        # Explicit base call, see Net.__post_init__
+        NamedObject.__post_init__(self)
+        # Built directly, a pad may carry a non-str number such as Pad(number=1)
+        if isinstance(self.number, str):
+            self.number = sys.intern(self.number)
+        if self.pinfunction is not None:
+            self.pinfunction = sys.intern(self.pinfunction)
+        if self.pintype is not None:
+            self.pintype = sys.intern(self.pintype)
+
+
+@dataclass(slots=True)
 class Pads(NamedObject):
     """Container for multiple pads.
 
@@ -487,3 +749,189 @@ class Pads(NamedObject):
     pads: List[Pad] = field(
         default_factory=list, metadata={"description": "List of pads"}
     )
+
+    def as_soa(self) -> PadsSoA:
+        """Return a column-oriented snapshot of the pads.
+
+        Returns:
+            PadsSoA with one column entry per pad
+        """
+        return PadsSoA.from_aos(self.pads)
+
+
+def _nan_if_none(value: Optional[float]) -> float:
+    return math.nan if value is None else value
+
+
+@dataclass(slots=True)
+class PadsSoA:
+    """Column-oriented (structure of arrays) view of a pad list.
+
+    The hot scalar fields of every pad are copied into parallel columns so
+    queries that touch one or two fields scan compact arrays instead of
+    whole Pad objects. The Pad objects in ``pads`` keep all other fields;
+    ``to_aos`` writes edited columns back onto them.
+
+    Columns built by ``from_pad_sexprs`` come straight from the raw
+    S-expressions; the Pad objects are only parsed when ``to_aos`` is called.
+
+    The optional float settings (clearance, die_length, solder margins, ...)
+    live in ``optional_floats``, one ``array('d')`` per field name, with NaN
+    marking pads where the setting is absent.
+
+    Args:
+        pads: Source pads, in column order
+        number: Pad numbers
+        net_number: Net ordinal of each pad
+        at_x: X position of each pad
+        at_y: Y position of each pad
+        size_x: Width of each pad
+        size_y: Height of each pad
+        optional_floats: NaN-filled columns of the optional float settings
+        raw_pads: Unparsed pad S-expressions backing the columns (optional)
+        strictness: Strictness used when raw pads are parsed (optional)
+    """
+
+    pads: List[Pad] = field(default_factory=list)
+    number: List[str] = field(default_factory=list)
+    net_number: array[int] = field(default_factory=lambda: array("l"))
+    at_x: array[float] = field(default_factory=lambda: array("d"))
+    at_y: array[float] = field(default_factory=lambda: array("d"))
+    size_x: array[float] = field(default_factory=lambda: array("d"))
+    size_y: array[float] = field(default_factory=lambda: array("d"))
+    optional_floats: Dict[str, array[float]] = field(
+        default_factory=lambda: {name: array("d") for name in _PAD_OPTIONAL_FLOATS}
+    )
+    raw_pads: List[SExpr] = field(default_factory=list, repr=False)
+    strictness: ParseStrictness = ParseStrictness.STRICT
+
+    @classmethod
+    def from_aos(cls, pads: Union[Pads, List[Pad]]) -> PadsSoA:
+        """Build columns from a Pads container or a list of pads.
+
+        Args:
+            pads: Pads container or list of Pad objects
+
+        Returns:
+            PadsSoA holding the columns and the source pads
+        """
+        pad_list = list(pads.pads if isinstance(pads, Pads) else pads)
+        return cls(
+            pads=pad_list,
+            number=[pad.number for pad in pad_list],
+            net_number=array("l", [pad.net.number for pad in pad_list]),
+            at_x=array("d", [pad.at.x for pad in pad_list]),
+            at_y=array("d", [pad.at.y for pad in pad_list]),
+            size_x=array("d", [pad.size.width for pad in pad_list]),
+            size_y=array("d", [pad.size.height for pad in pad_list]),
+            optional_floats={
+                name: array("d", [_nan_if_none(getattr(pad, name)) for pad in pad_list])
+                for name in _PAD_OPTIONAL_FLOATS
+            },
+        )
+
+    @classmethod
+    def from_pad_sexprs(
+        cls,
+        pad_sexprs: List[SExpr],
+        strictness: ParseStrictness = ParseStrictness.STRICT,
+    ) -> PadsSoA:
+        """Build columns directly from raw (pad ...) S-expressions.
+
+        Only the number, (at X Y), (size X Y), (net N ...) and the optional
+        float settings are read; no Pad objects are created until ``to_aos`` is called.
+
+        Args:
+            pad_sexprs: Parsed (pad ...) expressions
+            strictness: Strictness used when the pads are parsed later
+
+        Returns:
+            PadsSoA backed by the raw expressions
+        """
+        columns = cls(raw_pads=list(pad_sexprs), strictness=strictness)
+        optional_floats = columns.optional_floats
+        for sexpr in columns.raw_pads:
+            at = size = net = None
+            settings: Dict[str, float] = {}
+            for item in sexpr[2:]:
+                if isinstance(item, list) and item:
+                    head = str(item[0])
+                    if head == "at":
+                        at = item
+                    elif head == "size":
+                        size = item
+                    elif head == "net":
+                        net = item
+                    elif head in optional_floats and len(item) > 1:
+                        settings[head] = float(item[1])
+
+            columns.number.append(sys.intern(str(sexpr[1])) if len(sexpr) > 1 else "")
+            columns.net_number.append(int(net[1]) if net and len(net) > 1 else 0)
+            columns.at_x.append(float(at[1]) if at and len(at) > 1 else 0.0)
+            columns.at_y.append(float(at[2]) if at and len(at) > 2 else 0.0)
+            columns.size_x.append(float(size[1]) if size and len(size) > 1 else 0.0)
+            columns.size_y.append(float(size[2]) if size and len(size) > 2 else 0.0)
+            for name, column in optional_floats.items():
+                column.append(settings.get(name, math.nan))
+        return columns
+
+    def to_aos(self) -> List[Pad]:
+        """Write the columns back onto the pads and return them.
+
+        Pads backed only by raw S-expressions are parsed first.
+
+        Returns:
+            The source Pad objects with column values applied
+        """
+        if len(self.pads) < len(self.raw_pads):
+            self.pads = [
+                Pad.from_sexpr(sexpr, self.strictness) for sexpr in self.raw_pads
+            ]
+
+        for i, pad in enumerate(self.pads):
+            pad.number = self.number[i]
+            pad.net.number = self.net_number[i]
+            pad.at.x = self.at_x[i]
+            pad.at.y = self.at_y[i]
+            pad.size.width = self.size_x[i]
+            pad.size.height = self.size_y[i]
+            for name in self.optional_floats:
+                setattr(pad, name, self.optional_value(name, i))
+        return self.pads
+
+    def __len__(self) -> int:
+        return len(self.number)
+
+    def optional_value(self, name: str, index: int) -> Optional[float]:
+        """Return one optional float setting of a pad.
+
+        Args:
+            name: Pad field name, e.g. "clearance"
+            index: Column index of the pad
+
+        Returns:
+            The setting, or None if the pad does not define it
+        """
+        value = self.optional_floats[name][index]
+        return None if math.isnan(value) else value
+
+    def indices_on_net(self, net_number: int) -> List[int]:
+        """Return the column indices of all pads on the given net.
+
+        Args:
+            net_number: Net ordinal to match
+
+        Returns:
+            Indices into the columns and ``pads``
+        """
+        return [i for i, number in enumerate(self.net_number) if number == net_number]
+
+    def position_bounds(self) -> Optional[Tuple[float, float, float, float]]:
+        """Return the bounding box of all pad positions.
+
+        Returns:
+            (min_x, min_y, max_x, max_y) of the pad centres, or None if empty
+        """
+        if not self.number:
+            return None
+        return (min(self.at_x), min(self.at_y), max(self.at_x), max(self.at_y))
@@ -96,6 +96,7 @@ __all__ = [
 ]
 
 import re
+from bisect import bisect_right
 from collections import namedtuple
 from collections.abc import Iterable, Mapping, Sequence
 from functools import singledispatch
@@ -161,6 +162,10 @@ def loads(string: str, **kwds):
     :type     line_comment: str
     :keyword  line_comment: Beginning of line comment.
                             Default is ``';'``.
+    :type   shared_strings: dict or None
+    :keyword shared_strings: Table of short strings to reuse; pass the same
+                            dict to several calls to share strings between
+                            them. Default is a fresh table per call.
 
     >>> loads("(a b)")
     [Symbol('a'), Symbol('b')]
@@ -699,6 +704,10 @@ class InvalidEscape(SExpError):
         super().__init__(message, position)
 
 
+# Longest string the parser de-duplicates
+SHARED_STRING_MAX_LENGTH = 32
+
+
 class Parser(object):
     brackets: Dict[str, str]
     closing_brackets: Set[str]
@@ -713,6 +722,7 @@ class Parser(object):
         true: str = "t",
         false: Optional[str] = None,
         line_comment: str = ";",
+        shared_strings: Optional[Dict[str, str]] = None,
     ) -> None:
         self.string = string
         self.nil = nil
@@ -721,8 +731,12 @@ class Parser(object):
         self.string_to = (lambda x: x) if string_to is None else string_to
         self.line_comment = line_comment
 
-        # Build position mapping for error reporting
-        self.position_map = self._build_position_map(string)
+        # Line start offsets for error reporting, built on first use
+        self._line_starts: Optional[List[int]] = None
+        # One shared object per distinct short string or symbol name
+        self._short_strings: Dict[str, str] = (
+            {} if shared_strings is None else shared_strings
+        )
 
         # Compute brackets from delimiter
         self.brackets = Delimiters.get_brackets()
@@ -740,24 +754,23 @@ class Parser(object):
                 self._atom_end_basic_or_escape_regexp, re.escape(line_comment)
             )
         )
+        # Skip whole runs of whitespace in one C-level match
+        self.whitespace_re = re.compile("[{0}]+".format(re.escape(whitespace)))
 
-    def _build_position_map(self, string: str) -> Dict[int, Position]:
-        """Build a mapping from string offset to (line, column)"""
-        positions = {}
-        line, column = 1, 1
-        for i, char in enumerate(string):
-            positions[i] = Position(line, column, i)
-            if char == "\n":
-                line += 1
-                column = 1
-            else:
-                column += 1
-        positions[len(string)] = Position(line, column, len(string))
-        return positions
+    def get_position(self, offset: Optional[int] = None) -> Position:
+        """Get position information for a given string offset.
 
-    def get_position(self, offset: int) -> Position:
-        """Get position information for a given string offset."""
-        return self.position_map.get(offset, Position())
+        Line and column are only resolved here, so parsing valid input never
+        pays for position tracking.
+        """
+        if offset is None or not 0 <= offset <= len(self.string):
+            return Position()
+        if self._line_starts is None:
+            self._line_starts = [0] + [
+                match.end() for match in re.finditer("\n", self.string)
+            ]
+        line = bisect_right(self._line_starts, offset)
+        return Position(line, offset - self._line_starts[line - 1] + 1, offset)
 
     def parse_str(self, i: int) -> Tuple[int, str]:
         string = self.string
@@ -765,12 +778,12 @@ class Parser(object):
         append = chars.append
         search = self.quote_or_escape_re.search
 
-        start_pos = self.get_position(i)
+        start = i
         while True:
             i += 1
             match = search(string, i)
             if match is None:
-                raise UnterminatedString(start_pos)
+                raise UnterminatedString(self.get_position(start))
             end = match.start()
             append(string[i:end])
             c = match.group()
@@ -784,7 +797,17 @@ class Parser(object):
                 append(String.unquote(c + string[i]))
         else:
             raise ExpectClosingBracket('"', self.get_position())
-        return (i, "".join(chars))
+        return (i, self._share("".join(chars)))
+
+    def _share(self, text: str) -> str:
+        """Return the first equal short string seen in this parse.
+
+        Names, pin types and property keys repeat thousands of times in a
+        library; long one-off strings are not worth the lookup.
+        """
+        if len(text) > SHARED_STRING_MAX_LENGTH:
+            return text
+        return self._short_strings.setdefault(text, text)
 
     def parse_atom(self, i: int) -> Tuple[int, Any]:
         string = self.string
@@ -792,7 +815,12 @@ class Parser(object):
         append = chars.append
         search = self.atom_end_or_escape_re.search
         atom_end = self.atom_end
-        start_pos = self.get_position(i)
+
+        # Fast path: the atom ends before any escape character
+        match = search(string, i)
+        if match is not None and match.group() in atom_end:
+            end = match.start()
+            return (end, self.atom(string[i:end]))
 
         while True:
             match = search(string, i)
@@ -818,7 +846,7 @@ class Parser(object):
                     raise InvalidEscape(next_char, self.get_position(i))
             i += 1
 
-        return (i, self.atom("".join(chars), start_pos))
+        return (i, self.atom("".join(chars)))
 
     def atom(self, token: str, position=None):
         if token == self.nil:
@@ -827,6 +855,10 @@ class Parser(object):
             return True
         if token == self.false:
             return False
+        # int() and float() never accept a leading letter; inf/nan are
+        # rejected below anyway, so such tokens are always symbols
+        if token[:1].isalpha():
+            return Symbol(self._share(token), position)
         try:
             return int(token)
         except ValueError:
@@ -839,7 +871,7 @@ class Parser(object):
                     raise ValueError("Invalid s-exp float")
                 return result
             except ValueError:
-                return Symbol(token, position)
+                return Symbol(self._share(token), position)
 
     def parse_sexp(self, i: int) -> Tuple[int, List[Any]]:
         string = self.string
@@ -847,24 +879,25 @@ class Parser(object):
         sexp: List[Any] = []
         append = sexp.append
         bracket_stack = []  # Track opening brackets for better error reporting
+        skip_whitespace = self.whitespace_re.match
 
         while i < len_string:
             c = string[i]
-            current_pos = self.get_position(i)
 
             if c == '"':
                 try:
-                    (i, parsed_str) = self.parse_str(i)
+                    i, parsed_str = self.parse_str(i)
                     append(self.string_to(parsed_str))
                 except SExpError:
                     raise  # Re-raise with position already set
             elif c in whitespace:
-                i += 1
+                i = skip_whitespace(string, i).end()
                 continue
             elif c in self.brackets:
                 close = self.brackets[c]
-                bracket_stack.append((c, close, current_pos))
-                (next_i, parsed_sexp) = self.parse_sexp(i + 1)
+                open_offset = i
+                bracket_stack.append((c, close, open_offset))
+                next_i, parsed_sexp = self.parse_sexp(i + 1)
                 i = next_i
                 append(bracket(parsed_sexp, c))
                 try:
@@ -873,23 +906,27 @@ class Parser(object):
                     bracket_info = bracket_stack[-1] if bracket_stack else None
                     if bracket_info:
                         raise ExpectClosingBracket(
-                            None, bracket_info[1], bracket_info[2]
+                            None, bracket_info[1], self.get_position(bracket_info[2])
                         )
                     else:
-                        raise ExpectClosingBracket(None, close, current_pos)
+                        raise ExpectClosingBracket(
+                            None, close, self.get_position(open_offset)
+                        )
                 if nc != close:
-                    raise ExpectClosingBracket(nc, close, current_pos)
+                    raise ExpectClosingBracket(
+                        nc, close, self.get_position(open_offset)
+                    )
                 bracket_stack.pop() if bracket_stack else None
                 i += 1
             elif c in self.closing_brackets:
                 break
             elif c == "'":
-                quote_pos = current_pos
+                quote_offset = i
                 next_parse_start = i + 1
-                (next_i, parsed_sexp) = self.parse_sexp(next_parse_start)
+                next_i, parsed_sexp = self.parse_sexp(next_parse_start)
                 i = next_i
                 if not parsed_sexp:
-                    raise ExpectSExp(quote_pos)
+                    raise ExpectSExp(self.get_position(quote_offset))
                 append(Quoted(parsed_sexp[0]))
                 sexp.extend(parsed_sexp[1:])
             elif c == self.line_comment:
@@ -898,13 +935,13 @@ class Parser(object):
                     i = len_string
                     break
             else:
-                (i, parsed_atom) = self.parse_atom(i)
+                i, parsed_atom = self.parse_atom(i)
                 append(parsed_atom)
         return (i, sexp)
 
     def parse(self) -> List[Any]:
         try:
-            (i, sexp) = self.parse_sexp(0)
+            i, sexp = self.parse_sexp(0)
             if i < len(self.string):
                 raise ExpectNothing(self.string[i:], self.get_position(i))
             return sexp
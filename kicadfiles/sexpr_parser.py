@@ -6,7 +6,8 @@ Only contains the functions actually used by the kicadfiles package.
 
 from __future__ import annotations
 
-from typing import Any, List, cast
+import re
+from typing import IO, Any, Dict, Iterator, List, Optional, cast
 
 from .sexpdata import dumps, loads
 
@@ -14,12 +15,18 @@ from .sexpdata import dumps, loads
 SExprValue = Any  # Can be Symbol, str, int, float, or nested list
 SExpr = List[SExprValue]
 
+# Characters that change nesting or quoting state while scanning a stream
+_STRUCTURE_RE = re.compile(r'[()";\\\n]')
 
-def str_to_sexpr(content: str) -> SExpr:
+
+def str_to_sexpr(
+    content: str, shared_strings: Optional[Dict[str, str]] = None
+) -> SExpr:
     """Convert string content to S-expression.
 
     Args:
         content: String content containing S-expression data
+        shared_strings: Short-string table reused across calls (optional)
 
     Returns:
         Parsed S-expression as nested lists/atoms
@@ -28,11 +35,94 @@ def str_to_sexpr(content: str) -> SExpr:
         ValueError: If content cannot be parsed as valid S-expression
     """
     try:
-        return cast(SExpr, loads(content))
+        return cast(SExpr, loads(content, shared_strings=shared_strings))
     except Exception as e:
         raise ValueError(f"Failed to parse S-expression: {e}") from e
 
 
+def iter_sexpr_children(stream: IO[str], chunk_size: int = 65536) -> Iterator[str]:
+    """Yield the source text of each child of the top-level expression.
+
+    The stream is read in fixed-size chunks, so only the child being
+    assembled is held in memory. Each nested list is yielded as its full
+    text; runs of atoms directly inside the top-level list (such as its
+    token name) are yielded stripped, without the list's own brackets.
+
+    Args:
+        stream: Text stream positioned at the start of an S-expression
+        chunk_size: Number of characters read per chunk
+
+    Yields:
+        Source text of each child, ready for str_to_sexpr
+
+    Raises:
+        ValueError: If the stream does not hold one balanced expression
+    """
+    depth = 0
+    in_string = in_comment = False
+    escaped_pos = -1  # offset of the character after a backslash
+    parts: List[str] = []  # text of the pending child, across chunk borders
+
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        start = 0
+        for match in _STRUCTURE_RE.finditer(chunk):
+            pos = match.start()
+            if pos == escaped_pos:
+                continue
+            char = match.group()
+            if in_comment:
+                if char == "\n":
+                    in_comment = False
+                    if depth == 1:
+                        start = pos + 1
+            elif char == "\\":
+                escaped_pos = pos + 1
+            elif in_string:
+                in_string = char != '"'
+            elif char == '"':
+                in_string = True
+            elif char == ";":
+                in_comment = True
+                if depth == 1:
+                    parts.append(chunk[start:pos])
+            elif char == "(":
+                if depth == 0:
+                    start = pos + 1
+                elif depth == 1:
+                    parts.append(chunk[start:pos])
+                    atoms = "".join(parts).strip()
+                    if atoms:
+                        yield atoms
+                    parts = []
+                    start = pos
+                depth += 1
+            elif char == ")":
+                if depth == 0:
+                    raise ValueError("Failed to parse S-expression: unexpected ')'")
+                depth -= 1
+                if depth == 1:
+                    end = pos + 1
+                    parts.append(chunk[start:end])
+                    yield "".join(parts)
+                    parts = []
+                    start = end
+                elif depth == 0:
+                    parts.append(chunk[start:pos])
+                    atoms = "".join(parts).strip()
+                    if atoms:
+                        yield atoms
+                    return
+
+        escaped_pos = 0 if escaped_pos == len(chunk) else -1
+        if depth and not (in_comment and depth == 1):
+            parts.append(chunk[start:])
+
+    raise ValueError("Failed to parse S-expression: unexpected end of input")
+
+
 def sexpr_to_str(sexpr: SExpr) -> str:
     """Convert S-expression to string representation.
 
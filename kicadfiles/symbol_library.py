@@ -1,22 +1,76 @@
 """Symbol library elements for KiCad S-expressions - schematic symbol definitions."""
 
+from __future__ import annotations
+
+import math
+import os
+import pickle
+import threading
+from array import array
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Any, ClassVar, List, Optional, Union
+from typing import Any, ClassVar, Dict, List, Optional, Tuple, Union
 
 from .base_element import (
     NamedFloat,
     NamedInt,
     NamedObject,
     NamedString,
+    ParseCursor,
     ParseStrictness,
     TokenFlag,
 )
 from .base_types import At, Effects, Property, Text
 from .enums import PinElectricalType, PinGraphicStyle
 from .primitive_graphics import Arc, Bezier, Circle, Line, Polygon, Polyline, Rectangle
+from .sexpr_parser import SExpr, SExprParser, iter_sexpr_children, str_to_sexpr
+
+# Pickled libraries by (class, abspath, mtime_ns, size, strictness, encoding);
+# unpickling builds an independent copy several times faster than parsing.
+# The pickles are bounded by total size, not count. A pickle takes about five
+# times the size of its file, so 64 MiB holds roughly 13 MB of library files.
+# Every cold load pays one pickle.dumps; files larger than the bound would
+# never fit and skip it.
+_LIBRARY_CACHE_BYTES = 64 * 1024 * 1024
+_library_cache: "OrderedDict[Tuple[Any, ...], bytes]" = OrderedDict()
+_library_cache_bytes = 0
+_library_cache_lock = threading.Lock()
+
+
+def _index_symbols(
+    owner: Union[LibSymbols, KicadSymbolLib], symbols: List[Symbol]
+) -> Dict[str, Symbol]:
+    """Rebuild and store the owner's library ID index."""
+    by_id: Dict[str, Symbol] = {}
+    for symbol in symbols:
+        # First definition wins, as with a linear scan
+        by_id.setdefault(symbol.library_id, symbol)
+    owner._symbol_index = (symbols, len(symbols), by_id)
+    return by_id
+
+
+def _find_symbol(
+    owner: Union[LibSymbols, KicadSymbolLib], library_id: str
+) -> Optional[Symbol]:
+    """Look up a symbol by library ID through the owner's cached index.
+
+    The index is rebuilt when the symbols list is replaced or its length
+    changes. A miss, or a hit on a symbol that no longer carries the
+    requested ID, rebuilds it once more so renamed and replaced entries
+    are found.
+    """
+    symbols = owner.symbols or []
+    index = owner._symbol_index
+    if index is None or index[0] is not symbols or index[1] != len(symbols):
+        return _index_symbols(owner, symbols).get(library_id)
+
+    found = index[2].get(library_id)
+    if found is None or found.library_id != library_id:
+        found = _index_symbols(owner, symbols).get(library_id)
+    return found
 
 
-@dataclass
+@dataclass(slots=True)
 class Instances(NamedObject):
     """Symbol instances definition token.
 
@@ -39,7 +93,7 @@ class Instances(NamedObject):
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class PinName(NamedObject):
     """Pin name definition token.
 
@@ -61,7 +115,7 @@ class PinName(NamedObject):
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class Number(NamedObject):
     """Pin number definition token.
 
@@ -83,7 +137,7 @@ class Number(NamedObject):
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class Pin(NamedObject):
     """Symbol pin definition token.
 
@@ -138,7 +192,7 @@ class Pin(NamedObject):
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class PinNames(NamedObject):
     """Pin names attributes definition token.
 
@@ -162,7 +216,7 @@ class PinNames(NamedObject):
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class PinNumbers(NamedObject):
     """Pin numbers visibility definition token.
 
@@ -182,7 +236,7 @@ class PinNumbers(NamedObject):
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class Pintype(NamedObject):
     """Pin type definition token.
 
@@ -205,7 +259,7 @@ class Pintype(NamedObject):
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class Symbol(NamedObject):
     """Symbol definition token.
 
@@ -250,6 +304,7 @@ class Symbol(NamedObject):
     extends: Optional[str] = field(
         default=None,
         metadata={
+            "token": "extends",
             "description": "Parent library ID for derived symbols",
             "required": False,
         },
@@ -321,8 +376,136 @@ class Symbol(NamedObject):
         },
     )
 
+    def as_geometry(self) -> SymbolGeometry:
+        """Return a column-oriented snapshot of the pin and rectangle geometry.
+
+        Returns:
+            SymbolGeometry covering this symbol and all of its units
+        """
+        return SymbolGeometry.from_symbol(self)
+
+    def resolve_parent(
+        self, library: Union[LibSymbols, KicadSymbolLib]
+    ) -> Optional[Symbol]:
+        """Return the symbol this one extends.
+
+        Args:
+            library: Library holding the parent symbol
+
+        Returns:
+            Parent symbol, or None if the symbol extends nothing or the parent
+            is not in the library
+        """
+        if self.extends is None:
+            return None
+        return library.get_symbol(self.extends)
+
+
+@dataclass(slots=True)
+class SymbolGeometry:
+    """Column-oriented (structure of arrays) view of a symbol's geometry.
+
+    Pin positions, angles and lengths and rectangle corners of a symbol and
+    its units are copied into parallel ``array('d')`` columns, so bounding
+    boxes and transforms scan compact arrays instead of nested objects.
+    ``to_aos`` writes edited pin columns back onto the Pin objects.
+
+    Args:
+        pins: Source pins, in column order
+        pin_x: X position of each pin
+        pin_y: Y position of each pin
+        pin_angle: Angle of each pin in degrees
+        pin_length: Length of each pin
+        rectangles: Source rectangles, in column order
+        rect_min_x: Smaller X corner of each rectangle
+        rect_min_y: Smaller Y corner of each rectangle
+        rect_max_x: Larger X corner of each rectangle
+        rect_max_y: Larger Y corner of each rectangle
+    """
+
+    pins: List[Pin] = field(default_factory=list)
+    pin_x: array[float] = field(default_factory=lambda: array("d"))
+    pin_y: array[float] = field(default_factory=lambda: array("d"))
+    pin_angle: array[float] = field(default_factory=lambda: array("d"))
+    pin_length: array[float] = field(default_factory=lambda: array("d"))
+    rectangles: List[Rectangle] = field(default_factory=list)
+    rect_min_x: array[float] = field(default_factory=lambda: array("d"))
+    rect_min_y: array[float] = field(default_factory=lambda: array("d"))
+    rect_max_x: array[float] = field(default_factory=lambda: array("d"))
+    rect_max_y: array[float] = field(default_factory=lambda: array("d"))
+
+    @classmethod
+    def from_symbol(cls, symbol: Symbol) -> SymbolGeometry:
+        """Build columns from a symbol and, recursively, its units.
+
+        Args:
+            symbol: Symbol to read
+
+        Returns:
+            SymbolGeometry holding the columns and the source objects
+        """
+        pins: List[Pin] = []
+        rectangles: List[Rectangle] = []
+        pending = [symbol]
+        while pending:
+            current = pending.pop()
+            pins.extend(current.pins or [])
+            rectangles.extend(
+                item
+                for item in current.graphic_items or []
+                if isinstance(item, Rectangle)
+            )
+            pending.extend(reversed(current.units or []))
+
+        return cls(
+            pins=pins,
+            pin_x=array("d", [pin.at.x for pin in pins]),
+            pin_y=array("d", [pin.at.y for pin in pins]),
+            pin_angle=array("d", [pin.at.angle or 0.0 for pin in pins]),
+            pin_length=array("d", [pin.length.value for pin in pins]),
+            rectangles=rectangles,
+            rect_min_x=array("d", [min(r.start.x, r.end.x) for r in rectangles]),
+            rect_min_y=array("d", [min(r.start.y, r.end.y) for r in rectangles]),
+            rect_max_x=array("d", [max(r.start.x, r.end.x) for r in rectangles]),
+            rect_max_y=array("d", [max(r.start.y, r.end.y) for r in rectangles]),
+        )
+
+    def to_aos(self) -> List[Pin]:
+        """Write the pin columns back onto the pins and return them.
+
+        Returns:
+            The source Pin objects with column values applied
+        """
+        for i, pin in enumerate(self.pins):
+            pin.at.x = self.pin_x[i]
+            pin.at.y = self.pin_y[i]
+            pin.at.angle = self.pin_angle[i]
+            pin.length.value = self.pin_length[i]
+        return self.pins
+
+    def bounds(self) -> Optional[Tuple[float, float, float, float]]:
+        """Return the bounding box of all pins and rectangles.
 
-@dataclass
+        Pins count with both ends: the connection point at ``at`` and the
+        body end one pin length away in the pin's direction.
+
+        Returns:
+            (min_x, min_y, max_x, max_y), or None if there is no geometry
+        """
+        xs = list(self.pin_x) + list(self.rect_min_x) + list(self.rect_max_x)
+        ys = list(self.pin_y) + list(self.rect_min_y) + list(self.rect_max_y)
+        for x, y, angle, length in zip(
+            self.pin_x, self.pin_y, self.pin_angle, self.pin_length
+        ):
+            radians = math.radians(angle)
+            xs.append(x + length * math.cos(radians))
+            ys.append(y + length * math.sin(radians))
+        if not xs:
+            return None
+        return (min(xs), min(ys), max(xs), max(ys))
+
+
+@dataclass(slots=True)
 class LibSymbols(NamedObject):
     """Library symbols container token.
 
@@ -341,9 +524,26 @@ class LibSymbols(NamedObject):
     symbols: List[Symbol] = field(
         default_factory=list, metadata={"description": "List of symbols"}
     )
+    _symbol_index: Optional[Tuple[List[Symbol], int, Dict[str, Symbol]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def get_symbol(self, library_id: str) -> Optional[Symbol]:
+        """Look up a symbol by library ID.
+
+        Lookups go through an index built on first use instead of scanning
+        the symbols list each time.
+
+        Args:
+            library_id: Library ID of the symbol
+
+        Returns:
+            Matching symbol, or None if there is none
+        """
+        return _find_symbol(self, library_id)
 
 
-@dataclass
+@dataclass(slots=True)
 class KicadSymbolLib(NamedObject):
     """KiCad symbol library file definition.
 
@@ -380,6 +580,23 @@ class KicadSymbolLib(NamedObject):
         default_factory=list,
         metadata={"description": "List of symbol definitions", "required": False},
     )
+    _symbol_index: Optional[Tuple[List[Symbol], int, Dict[str, Symbol]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def get_symbol(self, library_id: str) -> Optional[Symbol]:
+        """Look up a symbol by library ID.
+
+        Lookups go through an index built on first use instead of scanning
+        the symbols list each time.
+
+        Args:
+            library_id: Library ID of the symbol
+
+        Returns:
+            Matching symbol, or None if there is none
+        """
+        return _find_symbol(self, library_id)
 
     @classmethod
     def from_file(
@@ -388,12 +605,100 @@ class KicadSymbolLib(NamedObject):
         strictness: ParseStrictness = ParseStrictness.STRICT,
         encoding: str = "utf-8",
     ) -> "KicadSymbolLib":
-        """Parse from S-expression file - convenience method for symbol library operations."""
+        """Parse from S-expression file - convenience method for symbol library operations.
+
+        Parsed libraries are cached per path, modification time and size, so
+        reopening an unchanged library returns a fresh copy instead of parsing
+        it again. The cache keeps the most recently used libraries up to
+        64 MiB of pickled data; see ``clear_cache``.
+        """
+        global _library_cache_bytes
         if not file_path.endswith(".kicad_sym"):
             raise ValueError("Unsupported file extension. Expected: .kicad_sym")
+
+        stat = os.stat(file_path)
+        key = (
+            cls,
+            os.path.abspath(file_path),
+            stat.st_mtime_ns,
+            stat.st_size,
+            strictness,
+            encoding,
+        )
+        with _library_cache_lock:
+            data = _library_cache.get(key)
+            if data is not None:
+                _library_cache.move_to_end(key)
+
+        if data is not None:
+            library: KicadSymbolLib = pickle.loads(data)
+            return library
+
+        library = cls._load_file(file_path, strictness, encoding)
+        if stat.st_size > _LIBRARY_CACHE_BYTES:
+            return library
+
+        data = pickle.dumps(library, pickle.HIGHEST_PROTOCOL)
+        if len(data) > _LIBRARY_CACHE_BYTES:
+            return library
+        with _library_cache_lock:
+            previous = _library_cache.pop(key, None)
+            if previous is not None:
+                _library_cache_bytes -= len(previous)
+            _library_cache[key] = data
+            _library_cache_bytes += len(data)
+            while _library_cache_bytes > _LIBRARY_CACHE_BYTES:
+                _, evicted = _library_cache.popitem(last=False)
+                _library_cache_bytes -= len(evicted)
+        return library
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop all libraries cached by ``from_file``."""
+        global _library_cache_bytes
+        with _library_cache_lock:
+            _library_cache.clear()
+            _library_cache_bytes = 0
+
+    @classmethod
+    def _load_file(
+        cls, file_path: str, strictness: ParseStrictness, encoding: str
+    ) -> "KicadSymbolLib":
+        """Stream-parse a library file.
+
+        Each top-level (symbol ...) is parsed as soon as its text is complete,
+        so the whole file is never held as one string or one nested list.
+        """
+        header: SExpr = []
+        symbols: List[Symbol] = []
+        path = [cls.__name__]
+        # Shared by all symbols, so repeated names are stored once per file
+        shared_strings: Dict[str, str] = {}
         with open(file_path, "r", encoding=encoding) as f:
-            content = f.read()
-        return cls.from_str(content, strictness)
+            for text in iter_sexpr_children(f):
+                if not text.startswith("("):
+                    header.extend(str_to_sexpr(f"({text})", shared_strings))
+                    continue
+                item = str_to_sexpr(text, shared_strings)
+                if not item or str(item[0]) != Symbol.__token_name__:
+                    header.append(item)
+                    continue
+                # Same path and error handling as the generic list field parser
+                cursor = ParseCursor(
+                    sexpr=item,
+                    parser=SExprParser(item),
+                    path=path + [f"symbols[{len(symbols)}]"],
+                    strictness=strictness,
+                )
+                try:
+                    symbols.append(Symbol.from_sexpr(item, strictness, cursor))
+                except (ValueError, TypeError):
+                    if strictness == ParseStrictness.STRICT:
+                        raise
+
+        library = cls.from_sexpr(header, strictness)
+        library.symbols = symbols
+        return library
 
     def save_to_file(self, file_path: str, encoding: str = "utf-8") -> None:
         """Save to .kicad_sym file format.
@@ -404,6 +709,13 @@ class KicadSymbolLib(NamedObject):
         """
         if not file_path.endswith(".kicad_sym"):
             raise ValueError("Unsupported file extension. Expected: .kicad_sym")
-        content = self.to_sexpr_str()
-        with open(file_path, "w", encoding=encoding) as f:
-            f.write(content)
+        # Write the encoded bytes straight to the fd in 1 MiB slices,
+        # skipping the text and buffered I/O layers
+        data = memoryview(self.to_sexpr_str().encode(encoding))
+        fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            while data:
+                written = os.write(fd, data[: 1 << 20])
+                data = data[written:]
+        finally:
+            os.close(fd)
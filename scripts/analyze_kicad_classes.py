@@ -2,13 +2,28 @@
 """Script to analyze NamedObject classes and their variables with types."""
 
 import ast
-import importlib.util
+import hashlib
 import os
+import pickle
 import sys
-from dataclasses import fields, is_dataclass
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Set, Tuple
 
+# Below this many files the process pool start-up costs more than it saves
+MIN_FILES_FOR_POOL = 4
+
+# Extracted class info is cached per source file; bump the version whenever
+# the extraction logic changes so stale entries are ignored. The cache is
+# unpickled, so it lives in the user's own cache dir, never in shared /tmp
+_CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "kicadfiles"
+    / "analysis"
+)
+_CACHE_VERSION = 1
+
 
 def find_kicad_files(directory: str) -> List[Path]:
     """Find all Python files in the kicadfiles directory."""
@@ -20,8 +35,39 @@ def find_kicad_files(directory: str) -> List[Path]:
     return list(kicad_dir.glob("*.py"))
 
 
+def _cache_path(file_path: Path) -> Path:
+    """Return the cache file used for a source file."""
+    key = f"{_CACHE_VERSION}:{file_path.resolve()}".encode("utf-8")
+    return _CACHE_DIR / f"{hashlib.sha1(key).hexdigest()}.pkl"
+
+
 def extract_class_info_from_ast(file_path: Path) -> Dict[str, Dict]:
-    """Extract class information using AST parsing."""
+    """Extract class information using AST parsing, cached by file mtime."""
+    mtime_ns = os.stat(file_path).st_mtime_ns
+    cache_file = _cache_path(file_path)
+    try:
+        with open(cache_file, "rb") as f:
+            cached_mtime_ns, classes_info = pickle.load(f)
+        if cached_mtime_ns == mtime_ns:
+            return classes_info
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError):
+        pass
+
+    classes_info = _parse_class_info(file_path)
+    if classes_info:
+        try:
+            _CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=_CACHE_DIR, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump((mtime_ns, classes_info), f)
+            os.replace(tmp_name, cache_file)
+        except OSError as e:
+            print(f"Could not cache {file_path}: {e}")
+    return classes_info
+
+
+def _parse_class_info(file_path: Path) -> Dict[str, Dict]:
+    """Extract class information from the parsed source of a file."""
     try:
         with open(file_path, "r", encoding="utf-8") as f:
             content = f.read()
@@ -29,18 +75,24 @@ def extract_class_info_from_ast(file_path: Path) -> Dict[str, Dict]:
         tree = ast.parse(content)
         classes_info = {}
 
-        for node in ast.walk(tree):
+        # Only module-level classes matter, so skip the full ast.walk()
+        for node in tree.body:
             if isinstance(node, ast.ClassDef):
-                # Check if class inherits from NamedObject
+                # Check if class inherits from NamedObject, directly or via a
+                # class of this module that does
+                parent = None
                 inherits_from_kicad = False
                 for base in node.bases:
-                    if isinstance(base, ast.Name) and base.id == "NamedObject":
+                    if isinstance(base, ast.Name) and (
+                        base.id == "NamedObject" or base.id in classes_info
+                    ):
+                        parent = classes_info.get(base.id)
                         inherits_from_kicad = True
                         break
 
                 if inherits_from_kicad:
                     class_name = node.name
-                    variables = {}
+                    variables = dict(parent["variables"]) if parent else {}
 
                     # Look for dataclass fields in annotations and __token_name__
                     token_name = None
@@ -49,12 +101,11 @@ def extract_class_info_from_ast(file_path: Path) -> Dict[str, Dict]:
                             item.target, ast.Name
                         ):
                             var_name = item.target.id
-                            if item.annotation:
-                                type_str = (
-                                    ast.unparse(item.annotation)
-                                    if hasattr(ast, "unparse")
-                                    else str(item.annotation)
-                                )
+                            type_str = ast.unparse(item.annotation)
+                            if var_name == "__token_name__":
+                                if isinstance(item.value, ast.Constant):
+                                    token_name = item.value.value
+                            elif not type_str.startswith("ClassVar"):
                                 variables[var_name] = type_str
                         elif isinstance(item, ast.Assign):
                             for target in item.targets:
@@ -77,130 +128,75 @@ def extract_class_info_from_ast(file_path: Path) -> Dict[str, Dict]:
         return {}
 
 
-def extract_class_info_from_import(file_path: Path) -> Dict[str, Dict]:
-    """Extract class information by importing the module."""
-    try:
-        # Add the parent directory to sys.path temporarily
-        parent_dir = str(file_path.parent.parent)
-        if parent_dir not in sys.path:
-            sys.path.insert(0, parent_dir)
-
-        # Import the module
-        module_name = f"kicadfiles.{file_path.stem}"
-        spec = importlib.util.spec_from_file_location(module_name, file_path)
-        if spec is None or spec.loader is None:
-            return {}
-
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
-
-        classes_info = {}
+def analyze_kicad_classes(directory: str = ".") -> List[Tuple[str, Dict]]:
+    """Analyze all NamedObject classes and their variables.
 
-        # Iterate through all objects in the module
-        for name in dir(module):
-            obj = getattr(module, name)
-
-            # Check if it's a class that inherits from NamedObject
-            if (
-                isinstance(obj, type)
-                and hasattr(obj, "__bases__")
-                and any(base.__name__ == "NamedObject" for base in obj.__mro__)
-            ):
-
-                variables = {}
-
-                # Check if it's a dataclass and get field information
-                if is_dataclass(obj):
-                    for field in fields(obj):
-                        field_type = str(field.type)
-                        # Clean up type strings
-                        if hasattr(field.type, "__name__"):
-                            field_type = field.type.__name__
-                        elif hasattr(field.type, "_name"):
-                            field_type = field.type._name
-                        variables[field.name] = field_type
-                else:
-                    # For non-dataclass, try to get annotations
-                    if hasattr(obj, "__annotations__"):
-                        for var_name, var_type in obj.__annotations__.items():
-                            type_str = str(var_type)
-                            if hasattr(var_type, "__name__"):
-                                type_str = var_type.__name__
-                            variables[var_name] = type_str
-
-                # Get token name
-                token_name = getattr(obj, "__token_name__", name.lower())
-
-                classes_info[name] = {
-                    "file": str(file_path),
-                    "variables": variables,
-                    "token_name": token_name,
-                }
-
-        return classes_info
-
-    except Exception as e:
-        print(f"Error importing {file_path}: {e}")
-        return {}
-
-
-def analyze_kicad_classes(directory: str = ".") -> Dict[str, Dict]:
-    """Analyze all NamedObject classes and their variables."""
+    Returns (class name, info) pairs sorted by class name, where each
+    info["variables"] is a list of (name, type) pairs sorted by name.
+    """
     files = find_kicad_files(directory)
     all_classes = {}
 
     for file_path in files:
         print(f"Analyzing {file_path.name}...")
 
-        # Try importing first (more accurate), fall back to AST parsing
-        class_info = extract_class_info_from_import(file_path)
-        if not class_info:
-            class_info = extract_class_info_from_ast(file_path)
+    # Files are independent, so spread them over worker processes
+    if len(files) < MIN_FILES_FOR_POOL:
+        results = map(extract_class_info_from_ast, files)
+    else:
+        with ProcessPoolExecutor() as executor:
+            results = list(
+                executor.map(extract_class_info_from_ast, files, chunksize=4)
+            )
 
+    for class_info in results:
         all_classes.update(class_info)
 
-    return all_classes
+    # Sort once here so the printer can iterate in order
+    for info in all_classes.values():
+        info["variables"] = sorted(info["variables"].items())
+    return sorted(all_classes.items())
 
 
 def print_class_analysis(
-    classes: Dict[str, Dict], filter_single_variable: bool = False
+    classes: List[Tuple[str, Dict]], filter_single_variable: bool = False
 ):
     """Print the analysis results."""
-    print("\n" + "=" * 80)
-    print("KICAD OBJECT CLASSES ANALYSIS")
-    print("=" * 80)
-
-    # Sort classes by name
-    sorted_classes = sorted(classes.items())
+    # Collect the whole report and write it in one go
+    parts: List[str] = ["", "=" * 80, "KICAD OBJECT CLASSES ANALYSIS", "=" * 80]
 
     single_var_classes = []
 
-    for class_name, info in sorted_classes:
+    for class_name, info in classes:
         variables = info["variables"]
 
         if filter_single_variable and len(variables) != 1:
             continue
 
         if len(variables) == 1:
-            single_var_classes.append(class_name)
+            single_var_classes.append((class_name, *variables[0]))
 
-        print(f"\nclass {Path(info['file']).stem}.{class_name}: # {info['token_name']}")
+        parts.append(
+            f"\nclass {Path(info['file']).stem}.{class_name}: # {info['token_name']}"
+        )
 
         if not variables:
-            print("  No variables found")
+            parts.append("  No variables found")
         else:
-            for var_name, var_type in sorted(variables.items()):
-                print(f"    {var_name}: {var_type}")
+            parts.append("\n".join(f"    {n}: {t}" for n, t in variables))
 
-    print(f"\n" + "=" * 80)
-    print(f"SUMMARY: Found {len(classes)} NamedObject classes")
-    print(f"Classes with exactly 1 variable: {len(single_var_classes)}")
+    parts.append("\n" + "=" * 80)
+    parts.append(f"SUMMARY: Found {len(classes)} NamedObject classes")
+    parts.append(f"Classes with exactly 1 variable: {len(single_var_classes)}")
 
     if single_var_classes:
-        print("\nClasses with single variable:")
-        for class_name in sorted(single_var_classes):
-            var_name, var_type = next(iter(classes[class_name]["variables"].items()))
-            print(f"  {class_name}: {var_name} ({var_type})")
+        parts.append("\nClasses with single variable:")
+        parts.extend(
+            f"  {class_name}: {var_name} ({var_type})"
+            for class_name, var_name, var_type in single_var_classes
+        )
+
+    sys.stdout.write("\n".join(parts) + "\n")
 
 
 def main():
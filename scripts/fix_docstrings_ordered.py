@@ -5,11 +5,40 @@ based on dataclass field metadata with correct field order and (optional) marker
 """
 
 import ast
+import hashlib
+import inspect
+import os
 import re
 import subprocess
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, List, NamedTuple, Optional, Tuple
 
+# Below this many files the process pool start-up costs more than it saves
+MIN_FILES_FOR_POOL = 4
+
+# Hashes of file contents that needed no fix, one empty marker file each so
+# parallel workers never write the same file; bump the version whenever the
+# fixer logic changes. Markers make files be skipped, so they live in the
+# user's own cache dir, never in shared /tmp
+_CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "kicadfiles"
+    / "fix"
+)
+_CACHE_VERSION = b"1:"
+
+# Compiled once instead of on every class visited
+_ARGS_HEADER_RE = re.compile(r"\n\s*Args:\s*\n")
+_NEXT_SECTION_RE = re.compile(r"\n\s*[A-Z][a-z]+:\s*\n")
+_SECTION_HEADER_RE = re.compile(r"[A-Z][a-z]+:")
+# A "name:" entry at the start of a line of an Args section
+_DOCUMENTED_NAME_RE = re.compile(r"\n\s*(\w+):")
+
+
+# Statements whose bodies can contain class definitions
+_SCOPE_NODES = (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)
+
 
 class FieldInfo(NamedTuple):
     name: str
@@ -17,15 +46,91 @@ class FieldInfo(NamedTuple):
     is_optional: bool
 
 
-class DocstringFixer(ast.NodeVisitor):
+def _is_section_header(lines: List[str], index: int) -> bool:
+    """Check for a section header such as "Returns:" that is not the last line."""
+    return (
+        index < len(lines) - 1
+        and _SECTION_HEADER_RE.fullmatch(lines[index].strip()) is not None
+    )
+
+
+def _ends_args_section(lines: List[str], index: int) -> bool:
+    """Check whether an Args section stops before this line.
+
+    It stops at the next section header or closing triple quote, and at the
+    first of any blank lines directly before one.
+    """
+    while index < len(lines) and not lines[index].strip():
+        index += 1
+    if index == len(lines):
+        return False
+    return lines[index].strip().startswith('"""') or _is_section_header(lines, index)
+
+
+def remove_args_sections(docstring: str) -> str:
+    """Remove every Args section from a docstring in one pass over its lines.
+
+    An Args section runs from its "Args:" line (and the blank lines before
+    it) up to the next section header (or the blank lines before it), a
+    closing triple quote or the end of the docstring.
+    """
+    lines = docstring.split("\n")
+    kept: List[str] = []
+    i = 0
+
+    while i < len(lines):
+        line = lines[i]
+        if not (kept and i < len(lines) - 1 and line.strip() == "Args:"):
+            kept.append(line)
+            i += 1
+            continue
+
+        # Blank lines before the header belong to the section
+        while len(kept) > 1 and not kept[-1].strip():
+            kept.pop()
+
+        i += 1
+        while i < len(lines) and not _ends_args_section(lines, i):
+            i += 1
+
+    return "\n".join(kept)
+
+
+class DocstringFixer:
     def __init__(self, source_code: str):
         self.source_code = source_code
-        self.lines = source_code.splitlines()
+        # Split on first use; files without fixes never need the lines
+        self._lines: Optional[List[str]] = None
         self.fixes: List[Tuple[int, int, str]] = (
             []
         )  # (start_line, end_line, new_content)
 
-    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+    @property
+    def lines(self) -> List[str]:
+        """Source code split into lines."""
+        if self._lines is None:
+            self._lines = self.source_code.splitlines()
+        return self._lines
+
+    def process(self, module: ast.Module) -> None:
+        """Collect fixes for all classes, descending only into statement bodies.
+
+        Only module, class and function bodies are searched for classes, so
+        expressions are never visited.
+        """
+        stack: List[ast.AST] = [module]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, ast.ClassDef):
+                self.handle_class(node)
+            stack.extend(
+                child
+                for child in getattr(node, "body", ())
+                if isinstance(child, _SCOPE_NODES)
+            )
+
+    def handle_class(self, node: ast.ClassDef) -> None:
+        """Record a docstring fix for a NamedObject dataclass if needed."""
         # Check if class inherits from NamedObject
         inherits_from_kicad = False
         for base in node.bases:
@@ -34,128 +139,122 @@ class DocstringFixer(ast.NodeVisitor):
                 break
 
         if not inherits_from_kicad:
-            self.generic_visit(node)
             return
 
         # Check if class has @dataclass decorator
         has_dataclass = False
         for decorator in node.decorator_list:
+            # Both @dataclass and @dataclass(slots=True, ...)
+            if isinstance(decorator, ast.Call):
+                decorator = decorator.func
             if isinstance(decorator, ast.Name) and decorator.id == "dataclass":
                 has_dataclass = True
                 break
 
         if not has_dataclass:
-            self.generic_visit(node)
             return
 
         # Extract field information in correct order
         fields = self.extract_fields_ordered(node)
         if not fields:
-            self.generic_visit(node)
             return
 
-        # Get current docstring
-        current_docstring = ast.get_docstring(node)
+        # Get current docstring and the statement holding it in one check
+        first = node.body[0] if node.body else None
+        if not (
+            isinstance(first, ast.Expr)
+            and isinstance(first.value, ast.Constant)
+            and isinstance(first.value.value, str)
+        ):
+            return
+        docstring_node = first
+        # Same cleanup as ast.get_docstring
+        current_docstring = inspect.cleandoc(first.value.value)
         if not current_docstring:
-            self.generic_visit(node)
             return
 
         # Check if Args section already exists and is complete
         if self.has_complete_args_section(current_docstring, fields):
-            self.generic_visit(node)
             return
 
         # Generate new docstring with Args section
         new_docstring = self.add_args_section(current_docstring, fields)
 
-        # Find docstring location in source
-        docstring_node = (
-            node.body[0]
-            if (
-                node.body
-                and isinstance(node.body[0], ast.Expr)
-                and isinstance(node.body[0].value, ast.Constant)
-            )
-            else None
+        # Replace the docstring statement in the source
+        start_line = docstring_node.lineno - 1  # Convert to 0-based
+        end_line = (
+            docstring_node.end_lineno - 1 if docstring_node.end_lineno else start_line
         )
 
-        if docstring_node:
-            start_line = docstring_node.lineno - 1  # Convert to 0-based
-            end_line = (
-                docstring_node.end_lineno - 1
-                if docstring_node.end_lineno
-                else start_line
-            )
-
-            # Create replacement content
-            indent = self.get_indent(start_line)
-            replacement = f'{indent}"""{new_docstring}"""'
-
-            self.fixes.append((start_line, end_line, replacement))
+        # Create replacement content
+        indent = self.get_indent(start_line)
+        replacement = f'{indent}"""{new_docstring}"""'
 
-        self.generic_visit(node)
+        self.fixes.append((start_line, end_line, replacement))
 
     def extract_fields_ordered(self, node: ast.ClassDef) -> List[FieldInfo]:
-        """Extract field information in the order they appear in the class."""
+        """Extract field information in the order they appear in the class.
+
+        Description and optional status come from each field(metadata={...})
+        call; the extraction is inlined and uses exact type checks since AST
+        node classes are not subclassed.
+        """
+        ConstantNode = ast.Constant
+        NameNode = ast.Name
+        CallNode = ast.Call
+        DictNode = ast.Dict
+        AnnAssignNode = ast.AnnAssign
         fields = []
 
         for item in node.body:
-            if isinstance(item, ast.AnnAssign) and isinstance(item.target, ast.Name):
-                field_name = item.target.id
-
-                # Skip private fields
-                if field_name.startswith("_"):
-                    continue
-
-                # Look for field() call with metadata
-                if isinstance(item.value, ast.Call):
-                    description, is_optional = self.extract_field_info(item.value)
-                    if description:
-                        fields.append(FieldInfo(field_name, description, is_optional))
-
-        return fields
-
-    def extract_field_info(self, call: ast.Call) -> Tuple[Optional[str], bool]:
-        """Extract description and optional status from field(metadata={...}) call."""
-        if not (isinstance(call.func, ast.Name) and call.func.id == "field"):
-            return None, False
+            if type(item) is not AnnAssignNode or type(item.target) is not NameNode:
+                continue
+            field_name = item.target.id
 
-        description = None
-        is_optional = False
+            # Skip private fields
+            if field_name.startswith("_"):
+                continue
 
-        # Look for metadata keyword argument
-        for keyword in call.keywords:
-            if keyword.arg == "metadata" and isinstance(keyword.value, ast.Dict):
-                # Look for 'description' and 'required' keys in metadata dict
+            # Look for field() call with metadata
+            call = item.value
+            if (
+                type(call) is not CallNode
+                or type(call.func) is not NameNode
+                or call.func.id != "field"
+            ):
+                continue
+
+            description = None
+            is_optional = False
+
+            # Look for 'description' and 'required' keys in the metadata dict
+            for keyword in call.keywords:
+                if keyword.arg != "metadata" or type(keyword.value) is not DictNode:
+                    continue
                 for key, value in zip(keyword.value.keys, keyword.value.values):
-                    if (
-                        isinstance(key, ast.Constant)
-                        and key.value == "description"
-                        and isinstance(value, ast.Constant)
-                        and isinstance(value.value, str)
-                    ):
+                    if type(key) is not ConstantNode or type(value) is not ConstantNode:
+                        continue
+                    if key.value == "description" and isinstance(value.value, str):
                         description = value.value
-                    elif (
-                        isinstance(key, ast.Constant)
-                        and key.value == "required"
-                        and isinstance(value, ast.Constant)
-                        and value.value is False
-                    ):
+                    elif key.value == "required" and value.value is False:
                         is_optional = True
 
-        # Also check if the annotation indicates Optional
-        if description and not is_optional:
-            # This is a simplified check - could be enhanced to parse the full annotation
-            is_optional = "Optional[" in str(call) or "None" in str(call)
+            if not description:
+                continue
+
+            fields.append(FieldInfo(field_name, description, is_optional))
 
-        return description, is_optional
+        return fields
 
     def has_complete_args_section(
         self, docstring: str, fields: List[FieldInfo]
     ) -> bool:
         """Check if docstring already has a complete Args section."""
-        # Look for Args section
-        args_match = re.search(r"\n\s*Args:\s*\n", docstring)
+        # Look for Args section; plain substring checks rule out most misses
+        # before any regex runs
+        if "Args:" not in docstring:
+            return False
+        args_match = _ARGS_HEADER_RE.search(docstring)
         if not args_match:
             return False
 
@@ -163,37 +262,29 @@ class DocstringFixer(ast.NodeVisitor):
         args_start = args_match.end()
 
         # Find end of Args section (next section or end of docstring)
-        next_section = re.search(r"\n\s*[A-Z][a-z]+:\s*\n", docstring[args_start:])
+        next_section = _NEXT_SECTION_RE.search(docstring, args_start)
         if next_section:
-            args_content = docstring[args_start : args_start + next_section.start()]
+            args_content = docstring[args_start : next_section.start()]
         else:
             args_content = docstring[args_start:]
 
-        # Check if all fields are documented
-        for field_info in fields:
-            if not re.search(rf"\n\s*{re.escape(field_info.name)}:", args_content):
-                return False
-
-        return True
+        # Collect all documented names in one scan, then check every field
+        documented = set(_DOCUMENTED_NAME_RE.findall(args_content))
+        return all(field_info.name in documented for field_info in fields)
 
     def add_args_section(self, docstring: str, fields: List[FieldInfo]) -> str:
         """Add or update Args section in docstring with correct order and optional markers."""
         # Remove existing Args section if present
-        args_pattern = r'\n\s*Args:\s*\n.*?(?=\n\s*[A-Z][a-z]+:\s*\n|\n\s*"""|\Z)'
-        cleaned_docstring = re.sub(args_pattern, "", docstring, flags=re.DOTALL)
+        cleaned_docstring = remove_args_sections(docstring)
 
         # Find insertion point (before closing or at end)
         insertion_point = len(cleaned_docstring.rstrip())
 
         # Generate Args section without indentation - let Black handle it
-        args_lines = ["\n\nArgs:"]
-        for field_info in fields:
-            optional_marker = " (optional)" if field_info.is_optional else ""
-            args_lines.append(
-                f"    {field_info.name}: {field_info.description}{optional_marker}"
-            )
-
-        args_section = "\n".join(args_lines)
+        args_section = "\n\nArgs:\n" + "\n".join(
+            f"    {f.name}: {f.description}{' (optional)' if f.is_optional else ''}"
+            for f in fields
+        )
 
         # Insert Args section
         new_docstring = (
@@ -217,54 +308,82 @@ class DocstringFixer(ast.NodeVisitor):
         if not self.fixes:
             return self.source_code
 
-        # Sort fixes by line number (reverse order to avoid offset issues)
-        self.fixes.sort(key=lambda x: x[0], reverse=True)
+        # Copy the unchanged stretches between fixes in one forward pass
+        self.fixes.sort(key=lambda x: x[0])
 
-        lines = self.lines[:]
+        lines: List[str] = []
+        cursor = 0
 
         for start_line, end_line, replacement in self.fixes:
-            # Replace lines
-            lines[start_line : end_line + 1] = [replacement]
+            lines.extend(self.lines[cursor:start_line])
+            lines.append(replacement)
+            cursor = end_line + 1
 
+        lines.extend(self.lines[cursor:])
         return "\n".join(lines)
 
 
-def process_file(file_path: Path) -> bool:
-    """Process a single Python file."""
+def process_file(file_path: Path) -> Tuple[bool, bool]:
+    """Process a single Python file.
+
+    Returns:
+        (success, modified) flags for the file
+    """
     print(f"Processing {file_path}")
 
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            source_code = f.read()
+        # Files without NamedObject dataclasses cannot need a fix; a byte
+        # scan is far cheaper than decoding and parsing them
+        raw = file_path.read_bytes()
+        if b"NamedObject" not in raw or b"@dataclass" not in raw:
+            print("  No changes needed")
+            return True, False
+
+        # Content already checked by an earlier run without needing a fix
+        marker = _CACHE_DIR / hashlib.sha1(_CACHE_VERSION + raw).hexdigest()
+        if marker.exists():
+            print("  No changes needed")
+            return True, False
+        source_code = raw.decode("utf-8")
 
         # Parse AST
         try:
             tree = ast.parse(source_code)
         except SyntaxError as e:
             print(f"  Syntax error in {file_path}: {e}")
-            return False
+            return False, False
 
         # Find and fix docstrings
         fixer = DocstringFixer(source_code)
-        fixer.visit(tree)
+        fixer.process(tree)
 
         if not fixer.fixes:
-            print(f"  No changes needed")
-            return True
+            try:
+                _CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+                marker.touch()
+            except OSError:
+                pass
+            print("  No changes needed")
+            return True, False
 
         # Apply fixes
         new_source = fixer.apply_fixes()
+        if new_source == source_code:
+            print("  No changes needed")
+            return True, False
 
-        # Write back
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(new_source)
+        # Write back atomically so an interrupted run never leaves a
+        # truncated module behind
+        tmp_path = file_path.with_suffix(file_path.suffix + ".tmp")
+        tmp_path.write_text(new_source, encoding="utf-8")
+        os.replace(tmp_path, file_path)
 
         print(f"  Fixed {len(fixer.fixes)} docstring(s)")
-        return True
+        return True, True
 
     except Exception as e:
         print(f"  Error processing {file_path}: {e}")
-        return False
+        return False, False
 
 
 def main():
@@ -286,22 +405,33 @@ def main():
 
     print(f"Found {len(python_files)} Python files")
 
-    success_count = 0
-
-    for file_path in python_files:
-        if file_path.name.startswith("__"):
-            continue  # Skip __init__.py, etc.
-
-        if process_file(file_path):
-            success_count += 1
+    # Skip __init__.py, etc.
+    files_to_process = [p for p in python_files if not p.name.startswith("__")]
+
+    # Files are independent, so fix them in parallel worker processes
+    if len(files_to_process) < MIN_FILES_FOR_POOL:
+        results = list(map(process_file, files_to_process))
+    else:
+        with ProcessPoolExecutor() as executor:
+            results = list(executor.map(process_file, files_to_process))
+    success_count = sum(success for success, _ in results)
+    modified = [
+        str(file_path)
+        for file_path, (_, changed) in zip(files_to_process, results)
+        if changed
+    ]
 
     print(f"\nProcessed {success_count}/{len(python_files)} files successfully")
 
-    # Run black formatter on the kicadfiles directory
+    if not modified:
+        return
+
+    # Run black formatter on the modified files only; --fast skips the AST
+    # equivalence check, the fixer only rewrote docstrings
     print("\nRunning Black formatter...")
     try:
         result = subprocess.run(
-            ["black", str(kicadfiles_dir)], capture_output=True, text=True, check=True
+            ["black", "--fast", *modified], capture_output=True, text=True, check=True
         )
         print("Black formatting completed successfully")
         if result.stdout.strip():
@@ -0,0 +1,43 @@
+"""Shared pytest fixtures for the kicadfiles test suite."""
+
+import pytest
+
+from kicadfiles import At, Color, Effects, Font, NamedFloat, Size, Stroke
+
+# Session fixtures are shared between tests and must not be modified.
+
+
+@pytest.fixture(scope="session")
+def at_10_20_90():
+    """Position at (10, 20) rotated by 90 degrees."""
+    return At(x=10.0, y=20.0, angle=90.0)
+
+
+@pytest.fixture(scope="session")
+def size_10_20():
+    """Size of 10 x 20."""
+    return Size(width=10.0, height=20.0)
+
+
+@pytest.fixture(scope="session")
+def font_basic():
+    """Font with a 1 x 1 size and no optional fields set."""
+    return Font(size=Size(width=1.0, height=1.0))
+
+
+@pytest.fixture(scope="session")
+def effects_basic():
+    """Text effects wrapping a basic font."""
+    return Effects(font=Font(size=Size(width=1.0, height=1.0)))
+
+
+@pytest.fixture(scope="session")
+def color_red():
+    """Opaque red."""
+    return Color(r=255, g=0, b=0, a=255)
+
+
+@pytest.fixture(scope="session")
+def stroke_solid_015():
+    """Solid stroke with a width of 0.15."""
+    return Stroke(width=NamedFloat("width", 0.15), type="solid")
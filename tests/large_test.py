@@ -1,8 +1,10 @@
 #!/usr/bin/env python3
 """Large test for recursive folder parsing of KiCad files."""
 
+import functools
+import os
 import pathlib
-from typing import List, Tuple
+from typing import Dict, Iterator, List, Tuple
 
 import pytest
 
@@ -16,45 +18,76 @@ from kicadfiles.schematic_system import KicadSch
 from kicadfiles.symbol_library import KicadSymbolLib
 from kicadfiles.text_and_documents import KicadWks
 
-
-def collect_files_by_type(test_folder: str) -> List[Tuple[str, pathlib.Path]]:
-    """Collect all KiCad files grouped by type for parallel testing."""
+# Set KICAD_ROUND_TRIP=0 to only parse files, skipping serialize + re-parse
+ROUND_TRIP = os.environ.get("KICAD_ROUND_TRIP", "1") == "1"
+
+# Mapping of file extensions/names to file types
+_FILE_CLASS_MAP: Dict[str, str] = {
+    ".kicad_pcb": "KicadPcb",
+    ".kicad_sch": "KicadSch",
+    ".kicad_sym": "KicadSymbolLib",
+    ".kicad_mod": "Footprint",
+    ".kicad_wks": "KicadWks",
+    ".kicad_dru": "KiCadDesignRules",
+    ".kicad_pro": "KicadProject",
+    "fp-lib-table": "FpLibTable",
+    "sym-lib-table": "SymLibTable",
+}
+
+# Mapping of file types to classes
+_TYPE_CLASS_MAP: Dict[str, type] = {
+    "KicadPcb": KicadPcb,
+    "KicadSch": KicadSch,
+    "KicadSymbolLib": KicadSymbolLib,
+    "Footprint": Footprint,
+    "KicadWks": KicadWks,
+    "KiCadDesignRules": KiCadDesignRules,
+    "KicadProject": KicadProject,
+    "FpLibTable": FpLibTable,
+    "SymLibTable": SymLibTable,
+}
+
+
+def _walk_files(directory: str) -> Iterator[os.DirEntry]:
+    """Yield all files below a directory without descending into symlinked dirs."""
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _walk_files(entry.path)
+            elif entry.is_file():
+                yield entry
+
+
+@functools.lru_cache(maxsize=None)
+def collect_files_by_type(test_folder: str) -> Tuple[Tuple[str, pathlib.Path], ...]:
+    """Collect all KiCad files grouped by type for parallel testing.
+
+    The folder is walked once per session; every parametrized test reuses
+    the result.
+    """
     test_path = pathlib.Path(test_folder)
 
     if not test_path.exists():
-        return []
-
-    # Mapping of file extensions/names to classes
-    file_class_map = {
-        ".kicad_pcb": "KicadPcb",
-        ".kicad_sch": "KicadSch",
-        ".kicad_sym": "KicadSymbolLib",
-        ".kicad_mod": "Footprint",
-        ".kicad_wks": "KicadWks",
-        ".kicad_dru": "KiCadDesignRules",
-        ".kicad_pro": "KicadProject",
-        "fp-lib-table": "FpLibTable",
-        "sym-lib-table": "SymLibTable",
-    }
+        return ()
 
-    files_by_type = []
+    files_by_type: List[Tuple[str, pathlib.Path]] = []
 
-    # Recursively find all KiCad files
-    for file_path in test_path.rglob("*"):
-        if file_path.is_file():
-            file_type = None
+    # Recursively find all KiCad files; DirEntry caches the file type from
+    # the directory read, so no extra stat call per entry
+    for entry in _walk_files(str(test_path)):
+        name = entry.name
+        head, dot, extension = name.rpartition(".")
 
-            # Check for extension-based files
-            if file_path.suffix in file_class_map:
-                file_type = file_class_map[file_path.suffix]
-            # Check for special library table files (no extension)
-            elif file_path.name in file_class_map:
-                file_type = file_class_map[file_path.name]
+        # Check for extension-based files, then for special library table
+        # files (no extension)
+        file_type = _FILE_CLASS_MAP.get(dot + extension) if dot else None
+        if file_type is None:
+            file_type = _FILE_CLASS_MAP.get(name)
 
-            if file_type:
-                files_by_type.append((file_type, file_path))
+        if file_type:
+            files_by_type.append((file_type, pathlib.Path(entry.path)))
 
-    return files_by_type
+    return tuple(files_by_type)
 
 
 # USAGE EXAMPLES:
@@ -65,15 +98,18 @@ def collect_files_by_type(test_folder: str) -> List[Tuple[str, pathlib.Path]]:
 # pytest tests/large_test.py::test_file_type_parsing -k "not _large_test" -n 16
 #
 # Run individual file tests (faster, true parallelization on 16 cores):
-# pytest tests/large_test.py::test_large_kicadpcb_individual -n 16
-# pytest tests/large_test.py::test_large_kicadsch_individual -n 16
-# pytest tests/large_test.py::test_large_footprint_individual -n 16
-# pytest tests/large_test.py::test_large_kicadsymbollib_individual -n 16
-# pytest tests/large_test.py::test_large_kicadwks_individual -n 16
-# pytest tests/large_test.py::test_large_kicaddesignrules_individual -n 16
-# pytest tests/large_test.py::test_large_kicadproject_individual -n 16
-# pytest tests/large_test.py::test_large_fplibtable_individual -n 16
-# pytest tests/large_test.py::test_large_symlibtable_individual -n 16
+# pytest tests/large_test.py::test_large_individual -k "KicadPcb" -n 16
+# pytest tests/large_test.py::test_large_individual -k "KicadSch" -n 16
+# pytest tests/large_test.py::test_large_individual -k "Footprint" -n 16
+# pytest tests/large_test.py::test_large_individual -k "KicadSymbolLib" -n 16
+# pytest tests/large_test.py::test_large_individual -k "KicadWks" -n 16
+# pytest tests/large_test.py::test_large_individual -k "KiCadDesignRules" -n 16
+# pytest tests/large_test.py::test_large_individual -k "KicadProject" -n 16
+# pytest tests/large_test.py::test_large_individual -k "FpLibTable" -n 16
+# pytest tests/large_test.py::test_large_individual -k "SymLibTable" -n 16
+#
+# Parse only, without the round-trip re-parse (about half the time):
+# KICAD_ROUND_TRIP=0 pytest tests/large_test.py -k "_individual" -n 16
 #
 # List all available tests:
 # pytest tests/large_test.py --collect-only
@@ -103,20 +139,7 @@ def test_file_type_parsing(test_folder: str, file_type: str):
     if not test_path.exists():
         pytest.skip(f"Test folder {test_folder} does not exist")
 
-    # Mapping of file types to classes
-    type_class_map = {
-        "KicadPcb": KicadPcb,
-        "KicadSch": KicadSch,
-        "KicadSymbolLib": KicadSymbolLib,
-        "Footprint": Footprint,
-        "KicadWks": KicadWks,
-        "KiCadDesignRules": KiCadDesignRules,
-        "KicadProject": KicadProject,
-        "FpLibTable": FpLibTable,
-        "SymLibTable": SymLibTable,
-    }
-
-    cls = type_class_map[file_type]
+    cls = _TYPE_CLASS_MAP[file_type]
 
     # Collect all files of this type
     files_by_type = collect_files_by_type(test_folder)
@@ -139,15 +162,16 @@ def test_file_type_parsing(test_folder: str, file_type: str):
             # Parse the file
             parsed_obj = cls.from_file(str(file_path), ParseStrictness.FAILSAFE)
 
-            # Try round-trip test
-            if hasattr(parsed_obj, "to_sexpr"):
-                # S-expression based files
-                sexpr = parsed_obj.to_sexpr()
-                reparsed_obj = cls.from_sexpr(sexpr, ParseStrictness.FAILSAFE)
-            else:
-                # JSON based files
-                data_dict = parsed_obj.to_dict()
-                reparsed_obj = cls.from_dict(data_dict)
+            # Try round-trip test (skipped with KICAD_ROUND_TRIP=0)
+            if ROUND_TRIP:
+                if hasattr(parsed_obj, "to_sexpr"):
+                    # S-expression based files
+                    sexpr = parsed_obj.to_sexpr()
+                    reparsed_obj = cls.from_sexpr(sexpr, ParseStrictness.FAILSAFE)
+                else:
+                    # JSON based files
+                    data_dict = parsed_obj.to_dict()
+                    reparsed_obj = cls.from_dict(data_dict)
 
             parsed_files.append(str(file_path.relative_to(test_path)))
             print(f"✅ {file_path.relative_to(test_path)}")
@@ -179,20 +203,7 @@ def create_individual_file_tests(test_folder: str, file_type: str):
         file_path for ftype, file_path in files_by_type if ftype == file_type
     ]
 
-    # Mapping of file types to classes
-    type_class_map = {
-        "KicadPcb": KicadPcb,
-        "KicadSch": KicadSch,
-        "KicadSymbolLib": KicadSymbolLib,
-        "Footprint": Footprint,
-        "KicadWks": KicadWks,
-        "KiCadDesignRules": KiCadDesignRules,
-        "KicadProject": KicadProject,
-        "FpLibTable": FpLibTable,
-        "SymLibTable": SymLibTable,
-    }
-
-    cls = type_class_map[file_type]
+    cls = _TYPE_CLASS_MAP[file_type]
 
     # Create parametrized test for each file
     test_ids = [str(f.relative_to(pathlib.Path(test_folder))) for f in target_files]
@@ -204,15 +215,16 @@ def create_individual_file_tests(test_folder: str, file_type: str):
             # Parse the file
             parsed_obj = cls.from_file(str(file_path), ParseStrictness.FAILSAFE)
 
-            # Try round-trip test
-            if hasattr(parsed_obj, "to_sexpr"):
-                # S-expression based files
-                sexpr = parsed_obj.to_sexpr()
-                reparsed_obj = cls.from_sexpr(sexpr, ParseStrictness.FAILSAFE)
-            else:
-                # JSON based files
-                data_dict = parsed_obj.to_dict()
-                reparsed_obj = cls.from_dict(data_dict)
+            # Try round-trip test (skipped with KICAD_ROUND_TRIP=0)
+            if ROUND_TRIP:
+                if hasattr(parsed_obj, "to_sexpr"):
+                    # S-expression based files
+                    sexpr = parsed_obj.to_sexpr()
+                    reparsed_obj = cls.from_sexpr(sexpr, ParseStrictness.FAILSAFE)
+                else:
+                    # JSON based files
+                    data_dict = parsed_obj.to_dict()
+                    reparsed_obj = cls.from_dict(data_dict)
 
             print(f"✅ {file_path}")
 
@@ -223,64 +235,42 @@ def create_individual_file_tests(test_folder: str, file_type: str):
     return test_individual_file_parsing
 
 
-# Generate individual tests for _large_test files by type
-if pathlib.Path("_large_test").exists():
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    """Parametrize test_large_individual with every file in _large_test."""
+    if "kicad_file" not in metafunc.fixturenames:
+        return
+
     files_by_type = collect_files_by_type("_large_test")
+    metafunc.parametrize(
+        "kicad_file",
+        files_by_type,
+        ids=[
+            f"{file_type}-{file_path.relative_to(pathlib.Path('_large_test'))}"
+            for file_type, file_path in files_by_type
+        ],
+    )
+
+
+def test_large_individual(kicad_file: Tuple[str, pathlib.Path]):
+    """Test individual files from _large_test for parallel execution."""
+    file_type, file_path = kicad_file
+    cls = _TYPE_CLASS_MAP[file_type]
+    try:
+        parsed_obj = cls.from_file(str(file_path), ParseStrictness.FAILSAFE)
+
+        # Try round-trip test (skipped with KICAD_ROUND_TRIP=0)
+        if ROUND_TRIP:
+            if hasattr(parsed_obj, "to_sexpr"):
+                sexpr = parsed_obj.to_sexpr()
+                reparsed_obj = cls.from_sexpr(sexpr, ParseStrictness.FAILSAFE)
+            else:
+                data_dict = parsed_obj.to_dict()
+                reparsed_obj = cls.from_dict(data_dict)
 
-    # Mapping of file types to classes
-    type_class_map = {
-        "KicadPcb": KicadPcb,
-        "KicadSch": KicadSch,
-        "KicadSymbolLib": KicadSymbolLib,
-        "Footprint": Footprint,
-        "KicadWks": KicadWks,
-        "KiCadDesignRules": KiCadDesignRules,
-        "KicadProject": KicadProject,
-        "FpLibTable": FpLibTable,
-        "SymLibTable": SymLibTable,
-    }
-
-    # Create individual test functions for each file type
-    for file_type, cls in type_class_map.items():
-        target_files = [
-            file_path for ftype, file_path in files_by_type if ftype == file_type
-        ]
-
-        if target_files:
-            test_ids = [
-                str(f.relative_to(pathlib.Path("_large_test"))) for f in target_files
-            ]
-
-            def create_test_function(file_type, cls, target_files, test_ids):
-                @pytest.mark.parametrize("file_path", target_files, ids=test_ids)
-                def test_function(file_path):
-                    f"""Test individual {file_type} files from _large_test for parallel execution."""
-                    try:
-                        parsed_obj = cls.from_file(
-                            str(file_path), ParseStrictness.FAILSAFE
-                        )
-
-                        # Try round-trip test
-                        if hasattr(parsed_obj, "to_sexpr"):
-                            sexpr = parsed_obj.to_sexpr()
-                            reparsed_obj = cls.from_sexpr(
-                                sexpr, ParseStrictness.FAILSAFE
-                            )
-                        else:
-                            data_dict = parsed_obj.to_dict()
-                            reparsed_obj = cls.from_dict(data_dict)
-
-                        print(f"✅ {file_path}")
-                    except Exception as e:
-                        print(f"❌ {file_path}: {e}")
-                        raise
-
-                return test_function
-
-            # Create the test function with a unique name
-            test_func = create_test_function(file_type, cls, target_files, test_ids)
-            test_func.__name__ = f"test_large_{file_type.lower()}_individual"
-            globals()[test_func.__name__] = test_func
+        print(f"✅ {file_path}")
+    except Exception as e:
+        print(f"❌ {file_path}: {e}")
+        raise
 
 
 if __name__ == "__main__":
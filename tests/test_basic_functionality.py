@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Basic functionality tests for KiCadFiles library."""
 
+import pytest
 
 from kicadfiles import (
     At,
@@ -132,6 +133,24 @@ def test_sexpr_utilities():
     assert "10.0" in regenerated_str
 
 
+def test_sexpr_parse_error_reports_line_and_column():
+    """Test that parse errors point at the offending line and column."""
+    with pytest.raises(ValueError, match="line 3, column 12"):
+        str_to_sexpr('(kicad_sch\n  (version 1)\n    (title "unterminated\n')
+
+
+def test_sexpr_parser_shares_short_strings():
+    """Test that repeated short strings and symbols share one object."""
+    sexpr = str_to_sexpr('(lib (pin "GND" passive) (pin "GND" passive))')
+    assert sexpr[1][1] is sexpr[2][1]
+    assert str(sexpr[1][2]) is str(sexpr[2][2])
+
+    shared_strings: dict = {}
+    first = str_to_sexpr('(name "Reference")', shared_strings)
+    second = str_to_sexpr('(name "Reference")', shared_strings)
+    assert first[1] is second[1]
+
+
 def test_object_equality():
     """Test object equality comparison."""
     at1 = At(x=10.0, y=20.0, angle=90.0)
@@ -1,6 +1,10 @@
 #!/usr/bin/env python3
 """Edge case tests for comprehensive coverage of __eq__ and parser strictness."""
 
+import contextlib
+import functools
+import re
+
 import pytest
 
 from kicadfiles import (
@@ -12,238 +16,197 @@ from kicadfiles import (
     Layer,
     LibraryEntry,
     NamedFloat,
+    NamedInt,
     ParseStrictness,
     Size,
     Stroke,
 )
+from kicadfiles.sexpr_parser import SExpr, str_to_sexpr
+
+# Expected error messages, compiled once for pytest.raises(match=...)
+TOKEN_MISMATCH_RE = re.compile(
+    r"Token mismatch.*expected 'size'.*got 'wrong_token'", re.S
+)
+CONVERSION_ERROR_RE = re.compile(r"Conversion failed|Cannot convert")
+
+
+@functools.lru_cache(maxsize=64)
+def _parsed(text: str) -> SExpr:
+    """Parse an S-expression once; from_sexpr does not modify the result."""
+    return str_to_sexpr(text)
+
+
+@pytest.fixture(scope="module")
+def eq_objects(at_10_20_90, size_10_20, font_basic, effects_basic, color_red):
+    """Objects shared by the __eq__ edge case tests, built once per module."""
+    return {
+        "at": at_10_20_90,
+        "at_same": At(x=10.0, y=20.0, angle=90.0),
+        "at_other_x": At(x=15.0, y=20.0, angle=90.0),
+        "font": font_basic,
+        "font_same": Font(size=Size(width=1.0, height=1.0)),
+        "font_thickness": Font(
+            size=Size(width=1.0, height=1.0), thickness=NamedFloat("thickness", 0.1)
+        ),
+        "effects": effects_basic,
+        "effects_same": Effects(font=Font(size=Size(width=1.0, height=1.0))),
+        "effects_other_font": Effects(font=Font(size=Size(width=2.0, height=1.0))),
+        "size": size_10_20,
+        "size_same": Size(width=10.0, height=20.0),
+        "size_other_width": Size(width=15.0, height=20.0),
+        "size_other_height": Size(width=10.0, height=25.0),
+        "color": color_red,
+        "color_same": Color(r=255, g=0, b=0, a=255),
+        "color_other": Color(r=0, g=255, b=0, a=255),
+        "layer": Layer(name="F.Cu"),
+    }
+
+
+@pytest.mark.parametrize(
+    "a,b",
+    [
+        ("at", "at_same"),
+        ("font", "font_same"),  # both optional fields None
+        ("effects", "effects_same"),
+        ("size", "size_same"),
+        ("color", "color_same"),
+    ],
+    ids=["at", "both_optional_none", "nested", "size", "color"],
+)
+def test_eq_identical(eq_objects, a, b):
+    """Test that objects with identical values are equal."""
+    assert eq_objects[a] == eq_objects[b]
+
+
+@pytest.mark.parametrize(
+    "a,b",
+    [
+        ("at", "at_other_x"),
+        ("size", "size_other_width"),
+        ("size", "size_other_height"),
+        ("color", "color_other"),
+        ("font", "font_thickness"),  # None vs non-None optional field
+    ],
+    ids=["diff_x", "diff_width", "diff_height", "diff_color", "optional_none_vs_set"],
+)
+def test_eq_primitive_diff(eq_objects, a, b):
+    """Test that differing field values make objects unequal."""
+    assert eq_objects[a] != eq_objects[b]
+
 
+def test_eq_nested(eq_objects):
+    """Test that a difference in a nested NamedObject makes objects unequal."""
+    effects = eq_objects["effects"]
+    assert effects != eq_objects["effects_other_font"]
 
-def test_eq_edge_cases():
-    """Test all edge cases of __eq__ method for comprehensive coverage."""
-    print("\n=== TESTING __eq__ EDGE CASES ===")
-
-    # Test 1: Same objects (happy path) - explicitly call __eq__
-    at1 = At(x=10.0, y=20.0, angle=90.0)
-    at2 = At(x=10.0, y=20.0, angle=90.0)
-    assert at1.__eq__(at2) == True
-    assert at1 == at2
-    print("✅ Test 1: Identical objects are equal")
-
-    # Test 2: Different primitive values - explicitly call __eq__
-    at3 = At(x=15.0, y=20.0, angle=90.0)
-    assert at1.__eq__(at3) == False
-    assert at1 != at3
-    print("✅ Test 2: Different primitive values are not equal")
-
-    # Test 3: Different types (not NamedObject) - explicitly call __eq__
-    # Note: __eq__ returns NotImplemented for non-NamedObjects, which is correct
-    # The != operator handles this properly
-    assert at1 != "not_a_kicad_object"
-    assert at1 != 42
-    assert at1 != None
-    assert at1 != []
-
-    # Test the actual __eq__ method return value
-    # Check what our implementation actually returns
-    eq_result = at1.__eq__("not_a_kicad_object")
-    print(f"    __eq__ with string returns: {eq_result}")
-    # Accept either False or NotImplemented as both are valid Python behavior
-    print("✅ Test 3: NamedObject != non-NamedObject")
-
-    # Test 4: Different NamedObject classes - explicitly call __eq__
-    layer = Layer(name="F.Cu")
-    # Note: dataclass __eq__ returns NotImplemented for different classes
-    # assert at1.__eq__(layer) == False  # This returns NotImplemented due to dataclass
-    assert at1 != layer  # This works because != handles NotImplemented properly
-    print("✅ Test 4: Different NamedObject classes are not equal")
-
-    # Test 5: Objects with None vs non-None fields - explicitly call __eq__
-    font1 = Font(size=Size(width=1.0, height=1.0))
-    font2 = Font(
-        size=Size(width=1.0, height=1.0), thickness=NamedFloat("thickness", 0.1)
-    )  # has optional thickness
-    assert font1.__eq__(font2) == False
-    assert font1 != font2
-    print("✅ Test 5: None vs non-None optional fields")
-
-    # Test 6: Both None fields - explicitly call __eq__
-    font3 = Font(size=Size(width=1.0, height=1.0))
-    font4 = Font(size=Size(width=1.0, height=1.0))
-    assert font3.__eq__(font4) == True
-    assert font3 == font4
-    print("✅ Test 6: Both None optional fields are equal")
-
-    # Test 7: Test with nested NamedObjects - explicitly call __eq__
-    effects1 = Effects(font=Font(size=Size(width=1.0, height=1.0)))
-    effects2 = Effects(font=Font(size=Size(width=1.0, height=1.0)))
-    effects3 = Effects(font=Font(size=Size(width=2.0, height=1.0)))  # Different nested
-
-    assert effects1.__eq__(effects2) == True
-    assert effects1.__eq__(effects3) == False
-    assert effects1 == effects2
-    assert effects1 != effects3
-    print("✅ Test 7: Nested NamedObject comparison")
-
-    # Test 8: Edge case with type checking using Size (simpler than At)
-    size1 = Size(width=10.0, height=20.0)
-    size2 = Size(width=10.0, height=20.0)
-    size3 = Size(width=15.0, height=20.0)  # Different width
-    size4 = Size(width=10.0, height=25.0)  # Different height
-
-    assert size1.__eq__(size2) == True
-    assert size1.__eq__(size3) == False  # Different width
-    assert size1.__eq__(size4) == False  # Different height
-    print("✅ Test 8: Size field comparison paths")
-
-    # Test 9: Multiple field comparison
-    color1 = Color(r=255, g=0, b=0, a=255)
-    color2 = Color(r=255, g=0, b=0, a=255)
-    color3 = Color(r=0, g=255, b=0, a=255)
-
-    assert color1.__eq__(color2) == True
-    assert color1.__eq__(color3) == False
-    assert color1 == color2
-    assert color1 != color3
-    print("✅ Test 9: Multiple field comparison")
-
-
-def test_parser_strictness_unused_parameters():
-    """Test that unused parameters are detected in STRICT mode."""
-    print("\n=== TESTING UNUSED PARAMETERS ===")
-
-    # Test STRICT mode with unused parameters using Size class
-    try:
-        # Use Size which has clear width/height parameters
-        result = Size.from_sexpr(
-            "(size 10.0 20.0 unused_param)", ParseStrictness.STRICT
-        )
-        print(
-            f"⚠️  STRICT mode allowed unused parameter (this may be expected behavior)"
-        )
-        print(f"    Result: {result}")
-    except ValueError as e:
-        error_msg = str(e)
-        assert "Unused parameters" in error_msg
-        print(f"✅ STRICT mode caught unused parameter: {error_msg}")
-
-    # Test with completely invalid structure
-    with pytest.raises(ValueError):
-        Size.from_sexpr("(size invalid_structure)", ParseStrictness.STRICT)
-    print("✅ STRICT mode caught invalid structure")
-
-    # Test FAILSAFE mode logs warning but continues
-    result = Size.from_sexpr("(size 10.0 20.0 unused_param)", ParseStrictness.FAILSAFE)
-    assert result.width == 10.0
-    assert result.height == 20.0
-    print("✅ FAILSAFE mode continued with unused parameters")
-
-    # Test SILENT mode ignores unused parameters
-    result = Size.from_sexpr("(size 10.0 20.0 unused_param)", ParseStrictness.SILENT)
-    assert result.width == 10.0
-    assert result.height == 20.0
-    print("✅ SILENT mode ignored unused parameters")
-
-
-def test_parser_strictness_missing_required():
-    """Test that missing required parameters are detected in STRICT mode."""
-    print("\n=== TESTING MISSING REQUIRED PARAMETERS ===")
-
-    # Test minimal required parsing using Size (simpler structure)
-    try:
-        result = Size.from_sexpr("(size 10.0)", ParseStrictness.STRICT)
-        print(f"📝 STRICT mode with minimal params: {result}")
-    except ValueError as e:
-        print(f"📝 STRICT mode correctly rejected minimal params: {e}")
-
-    # Test completely empty Size
-    try:
-        result_empty = Size.from_sexpr("(size)", ParseStrictness.STRICT)
-        print(f"📝 STRICT mode with no params: {result_empty}")
-    except ValueError as e:
-        print(f"📝 STRICT mode correctly rejected empty params: {e}")
-
-    # Test invalid token to ensure strictness works
-    with pytest.raises(ValueError) as exc_info:
-        Size.from_sexpr("(not_size 10.0 20.0)", ParseStrictness.STRICT)
-    print("✅ STRICT mode caught wrong token name")
-
-    # Test FAILSAFE mode uses defaults for missing fields
-    result = Size.from_sexpr("(size 10.0)", ParseStrictness.FAILSAFE)
-    assert result.width == 10.0
-    assert result.height == 0.0  # Uses default value
-    print("✅ FAILSAFE mode handled missing field")
-
-    # Test SILENT mode uses defaults for missing fields
-    result = Size.from_sexpr("(size 10.0)", ParseStrictness.SILENT)
-    assert result.width == 10.0
-    assert result.height == 0.0  # Uses default value
-    print("✅ SILENT mode handled missing field")
-
-
-def test_parser_strictness_wrong_token():
-    """Test that wrong token names are detected."""
-    print("\n=== TESTING WRONG TOKENS ===")
-
-    # Test completely wrong token name
-    with pytest.raises(ValueError) as exc_info:
-        Size.from_sexpr("(wrong_token 10.0 20.0)", ParseStrictness.STRICT)
-
-    error_msg = str(exc_info.value)
-    assert "Token mismatch" in error_msg
-    assert "expected 'size'" in error_msg
-    assert "got 'wrong_token'" in error_msg
-    print(f"✅ Wrong token name detected: {error_msg}")
-
-    # Test empty sexpr
-    with pytest.raises(ValueError) as exc_info:
-        Size.from_sexpr("", ParseStrictness.STRICT)
-
-    error_msg = str(exc_info.value)
-    print(f"✅ Empty input detected: {error_msg}")
+
+@pytest.mark.parametrize(
+    "other",
+    ["not_a_kicad_object", 42, None, []],
+    ids=["cross_type_str", "cross_type_int", "cross_type_none", "cross_type_list"],
+)
+def test_eq_cross_type(eq_objects, other):
+    """Test that a NamedObject never equals a non-NamedObject."""
+    # Called explicitly to cover the NotImplemented return; != handles it
+    assert eq_objects["at"].__eq__(other) is NotImplemented
+    assert eq_objects["at"] != other
+
+
+def test_eq_named_values():
+    """Test the identity shortcut and exact type check of NamedValue.__eq__."""
+    thickness = NamedFloat("thickness", 0.1)
+    assert thickness == thickness
+    assert thickness == NamedFloat("thickness", 0.1)
+    assert thickness != NamedFloat("width", 0.1)
+    assert NamedInt("version", 7) != NamedFloat("version", 7.0)
+    assert thickness != 0.1
+
+
+def test_eq_different_class(eq_objects):
+    """Test that NamedObjects of different classes are not equal."""
+    assert eq_objects["at"] != eq_objects["layer"]
+
+
+# (input, strictness, expected (width, height) or the expected error pattern)
+SIZE_STRICTNESS_CASES = [
+    ("", ParseStrictness.STRICT, "Failed to parse"),
+    ("(wrong_token 10.0 20.0)", ParseStrictness.STRICT, TOKEN_MISMATCH_RE),
+    ("(size invalid_structure)", ParseStrictness.STRICT, "Cannot convert"),
+    ("(not_size 10.0 20.0)", ParseStrictness.STRICT, "Token mismatch"),
+    ("(size 10.0)", ParseStrictness.STRICT, "Missing required float 'height'"),
+    ("(size)", ParseStrictness.STRICT, "Missing required float 'width'"),
+    # Unused trailing parameters are ignored in every mode
+    ("(size 10.0 20.0 unused_param)", ParseStrictness.STRICT, (10.0, 20.0)),
+    ("(size 10.0 20.0 unused_param)", ParseStrictness.FAILSAFE, (10.0, 20.0)),
+    ("(size 10.0 20.0 unused_param)", ParseStrictness.SILENT, (10.0, 20.0)),
+    ("(size 10.0)", ParseStrictness.FAILSAFE, (10.0, 0.0)),  # default height
+    ("(size 10.0)", ParseStrictness.SILENT, (10.0, 0.0)),  # default height
+]
+
+
+@pytest.mark.parametrize(
+    "text,strictness,expected",
+    SIZE_STRICTNESS_CASES,
+    ids=[
+        "empty_input_strict",
+        "wrong_token_name_strict",
+        "invalid_structure_strict",
+        "wrong_token_strict",
+        "missing_strict",
+        "empty_strict",
+        "unused_strict",
+        "unused_failsafe",
+        "unused_silent",
+        "missing_failsafe",
+        "missing_silent",
+    ],
+)
+def test_parser_strictness_size(text, strictness, expected):
+    """Test how each strictness mode handles malformed Size expressions."""
+    succeeds = isinstance(expected, tuple)
+    outcome = (
+        contextlib.nullcontext()
+        if succeeds
+        else pytest.raises(ValueError, match=expected)
+    )
+    with outcome:
+        result = Size.from_sexpr(_parsed(text), strictness)
+    if succeeds:
+        assert (result.width, result.height) == expected
 
 
 def test_conversion_errors():
     """Test type conversion errors in STRICT mode."""
-    print("\n=== TESTING TYPE CONVERSION ERRORS ===")
 
     # Test invalid float conversion
-    with pytest.raises(ValueError) as exc_info:
+    with pytest.raises(ValueError, match=CONVERSION_ERROR_RE):
         At.from_sexpr("(at not_a_number 20.0)", ParseStrictness.STRICT)
 
-    error_msg = str(exc_info.value)
-    assert "Conversion failed" in error_msg or "Cannot convert" in error_msg
-    print(f"✅ Invalid float conversion detected: {error_msg}")
-
     # Test FAILSAFE mode handles conversion errors
     result = At.from_sexpr("(at not_a_number 20.0)", ParseStrictness.FAILSAFE)
     assert result.x == 0.0  # Failed conversion uses default value
     assert result.y == 20.0
-    print("✅ FAILSAFE mode handled conversion error (result uses default)")
 
 
-def test_complex_nested_equality():
+def test_complex_nested_equality(stroke_solid_015):
     """Test equality with complex nested structures."""
-    print("\n=== TESTING COMPLEX NESTED EQUALITY ===")
 
     # Create complex nested structures
-    stroke1 = Stroke(width=NamedFloat("width", 0.15), type="solid")
+    stroke1 = stroke_solid_015
     stroke2 = Stroke(width=NamedFloat("width", 0.15), type="solid")
     stroke3 = Stroke(width=NamedFloat("width", 0.20), type="solid")  # Different width
 
     assert stroke1 == stroke2
     assert stroke1 != stroke3
-    print("✅ Complex nested object equality works")
 
     # Test with None nested objects
     stroke4 = Stroke(width=NamedFloat("width", 0.15), type="solid")
     # Assuming Stroke has optional color field
     assert stroke1 == stroke4  # Both should have None for optional fields
-    print("✅ Objects with None optional nested fields are equal")
 
 
 def test_nested_subelement_parameter_validation():
     """Test parameter validation in nested subelements (fp_lib_table with lib entries)."""
-    print("\n=== TESTING NESTED SUBELEMENT PARAMETER VALIDATION ===")
 
     # Valid fp_lib_table structure
     valid_sexpr = """(fp_lib_table
@@ -261,7 +224,6 @@ def test_nested_subelement_parameter_validation():
     assert result.libraries[0].descr.value == "Audio Module footprints"
     assert result.libraries[1].name.value == "Battery"
     assert result.libraries[2].name.value == "Snapeda"
-    print("✅ Valid nested structure parsed correctly")
 
     # Test with extra parameter in subelement (lib)
     extra_param_sexpr = """(fp_lib_table
@@ -270,21 +232,14 @@ def test_nested_subelement_parameter_validation():
   (lib (name "Battery")(type "KiCad")(uri "${KICAD8_FOOTPRINT_DIR}/Battery.pretty")(options "")(descr "Battery"))
 )"""
 
-    try:
-        result = FpLibTable.from_str(extra_param_sexpr, ParseStrictness.STRICT)
-        print(
-            f"⚠️  STRICT mode allowed extra parameter in subelement (this may be expected behavior)"
-        )
-        print(f"    Result: {result.libraries[0]}")
-    except ValueError as e:
-        error_msg = str(e)
-        print(f"✅ STRICT mode caught extra parameter in subelement: {error_msg}")
+    # Unknown tokens inside a subelement are ignored, even in STRICT mode
+    result = FpLibTable.from_str(extra_param_sexpr, ParseStrictness.STRICT)
+    assert len(result.libraries) == 2
 
     # Test FAILSAFE mode with extra parameter
     result = FpLibTable.from_str(extra_param_sexpr, ParseStrictness.FAILSAFE)
     assert len(result.libraries) == 2
     assert result.libraries[0].name.value == "Audio_Module"
-    print("✅ FAILSAFE mode handled extra parameter in subelement")
 
     # Test with missing parameter in subelement (missing descr)
     missing_param_sexpr = """(fp_lib_table
@@ -294,15 +249,8 @@ def test_nested_subelement_parameter_validation():
 )"""
 
     # STRICT mode should catch missing parameter in subelement (even with default value)
-    try:
-        result = FpLibTable.from_str(missing_param_sexpr, ParseStrictness.STRICT)
-        assert False, "STRICT mode should have caught missing parameter"
-    except ValueError as e:
-        error_msg = str(e)
-        assert "descr" in error_msg and (
-            "not found" in error_msg or "Missing" in error_msg
-        )
-        print(f"✅ STRICT mode caught missing parameter in subelement: {error_msg}")
+    with pytest.raises(ValueError, match="'descr' not found"):
+        FpLibTable.from_str(missing_param_sexpr, ParseStrictness.STRICT)
 
     # FAILSAFE mode should handle missing parameter and use default
     result = FpLibTable.from_str(missing_param_sexpr, ParseStrictness.FAILSAFE)
@@ -310,7 +258,6 @@ def test_nested_subelement_parameter_validation():
     assert result.libraries[0].name.value == "Audio_Module"
     assert result.libraries[0].descr.value == ""  # Uses default empty string
     assert result.libraries[1].descr.value == "Battery"
-    print("✅ FAILSAFE mode handled missing parameter in subelement (used default)")
 
     # Test with completely wrong token in subelement
     wrong_token_sexpr = """(fp_lib_table
@@ -318,18 +265,12 @@ def test_nested_subelement_parameter_validation():
   (wrong_token (name "Audio_Module")(type "KiCad"))
 )"""
 
-    try:
-        result = FpLibTable.from_str(wrong_token_sexpr, ParseStrictness.STRICT)
-        print(f"⚠️  STRICT mode allowed wrong token in subelement: {result}")
-    except ValueError as e:
-        error_msg = str(e)
-        print(f"✅ STRICT mode caught wrong token in subelement: {error_msg}")
+    # Unknown subelements are skipped, even in STRICT mode
+    result = FpLibTable.from_str(wrong_token_sexpr, ParseStrictness.STRICT)
+    assert result.libraries == []
 
     # Test FAILSAFE mode with wrong token in subelement
-    result = FpLibTable.from_str(wrong_token_sexpr, ParseStrictness.FAILSAFE)
-    print(
-        f"✅ FAILSAFE mode handled wrong token in subelement (libraries: {len(result.libraries)})"
-    )
+    FpLibTable.from_str(wrong_token_sexpr, ParseStrictness.FAILSAFE)
 
     # Test with mixed valid and invalid subelements
     mixed_sexpr = """(fp_lib_table
@@ -341,17 +282,3 @@ def test_nested_subelement_parameter_validation():
 
     result = FpLibTable.from_str(mixed_sexpr, ParseStrictness.FAILSAFE)
     assert len(result.libraries) >= 2  # Should parse at least the valid ones
-    print(
-        f"✅ FAILSAFE mode handled mixed valid/invalid subelements ({len(result.libraries)} libraries)"
-    )
-
-
-if __name__ == "__main__":
-    test_eq_edge_cases()
-    test_parser_strictness_unused_parameters()
-    test_parser_strictness_missing_required()
-    test_parser_strictness_wrong_token()
-    test_conversion_errors()
-    test_complex_nested_equality()
-    test_nested_subelement_parameter_validation()
-    print("\n🎉 All edge case tests passed!")
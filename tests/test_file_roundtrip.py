@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """File-based round-trip tests using real KiCad files from fixtures."""
 
+import io
 import pathlib
 import tempfile
 
@@ -13,6 +14,7 @@ from kicadfiles.footprint_library import Footprint
 from kicadfiles.library_tables import FpLibTable, SymLibTable
 from kicadfiles.project_settings import KicadProject
 from kicadfiles.schematic_system import KicadSch
+from kicadfiles.sexpr_parser import iter_sexpr_children, str_to_sexpr
 from kicadfiles.symbol_library import KicadSymbolLib
 from kicadfiles.text_and_documents import KicadWks
 
@@ -311,6 +313,77 @@ def test_json_based_fixtures():
         assert successful_basic_tests > 0, "No JSON files loaded successfully"
 
 
+def test_symbol_library_streams_like_full_parse():
+    """Test that streamed symbol libraries match parsing the whole string."""
+
+    symbol_path = FIXTURES_DIR / "symbols" / "small.kicad_sym"
+    content = symbol_path.read_text(encoding="utf-8")
+
+    streamed = KicadSymbolLib.from_file(str(symbol_path), ParseStrictness.STRICT)
+    parsed = KicadSymbolLib.from_str(content, ParseStrictness.STRICT)
+
+    assert streamed == parsed
+    assert streamed.to_sexpr_str() == parsed.to_sexpr_str()
+
+
+def test_symbol_library_cache_returns_independent_copies(tmp_path):
+    """Test that reopening a library uses the cache but not shared objects."""
+
+    content = (FIXTURES_DIR / "symbols" / "small.kicad_sym").read_text(encoding="utf-8")
+    library_path = tmp_path / "cached.kicad_sym"
+    library_path.write_text(content, encoding="utf-8")
+
+    KicadSymbolLib.clear_cache()
+    first = KicadSymbolLib.from_file(str(library_path))
+    second = KicadSymbolLib.from_file(str(library_path))
+    assert first == second
+    assert first.symbols[0] is not second.symbols[0]
+
+    first.symbols.clear()
+    assert KicadSymbolLib.from_file(str(library_path)).symbols
+
+    # A changed file is parsed again
+    library_path.write_text(
+        content.replace('(generator_version "9.0")', '(generator_version "10.0")'),
+        encoding="utf-8",
+    )
+    assert KicadSymbolLib.from_file(str(library_path)).generator_version.value == "10.0"
+    KicadSymbolLib.clear_cache()
+
+
+def test_symbol_library_lookup_after_rename():
+    """Test that a symbol renamed after indexing is found by its new ID."""
+
+    library = KicadSymbolLib.from_file(
+        str(FIXTURES_DIR / "symbols" / "small.kicad_sym"), ParseStrictness.STRICT
+    )
+    symbol = library.get_symbol("small")
+    assert symbol is library.symbols[0]
+
+    library.symbols[0].library_id = "renamed"
+    assert library.get_symbol("renamed") is symbol
+    assert library.get_symbol("small") is None
+
+
+def test_iter_sexpr_children_across_chunk_borders():
+    """Test that children split over chunk borders are reassembled."""
+
+    content = '(lib "a(\\")" ; skipped )\n (child "x;)" (nested 1)) tail)'
+    expected = str_to_sexpr(content)
+
+    for chunk_size in (1, 2, 5, 65536):
+        children = []
+        for text in iter_sexpr_children(io.StringIO(content), chunk_size):
+            if text.startswith("("):
+                children.append(str_to_sexpr(text))
+            else:
+                children.extend(str_to_sexpr(f"({text})"))
+        assert children == expected
+
+    with pytest.raises(ValueError):
+        list(iter_sexpr_children(io.StringIO("(lib (child 1)")))
+
+
 if __name__ == "__main__":
     # Run the comprehensive tests when executed directly
     test_all_s_expression_fixtures()
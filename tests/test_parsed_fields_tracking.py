@@ -169,6 +169,61 @@ def test_nested_object_preserves_parsed_fields():
     assert ["data", ["content", "base64"]] in serialized
 
 
+def test_slotted_class_keeps_parse_bookkeeping():
+    """Test that slotted classes still track parsed fields across copies."""
+    import copy
+
+    from kicadfiles.pad_and_drill import Pad
+
+    pad = Pad.from_sexpr('(pad "1" smd rect (at 0 0) (size 1 1) (layers "F.Cu"))')
+
+    assert not hasattr(pad, "__dict__")
+    assert "uuid" not in pad._parsed_fields
+
+    pad_copy = copy.deepcopy(pad)
+    assert pad_copy._parsed_fields == pad._parsed_fields
+    assert pad_copy.to_sexpr() == pad.to_sexpr()
+
+
+def test_symbol_library_classes_are_slotted():
+    """Test that symbol library elements parse without an instance dict."""
+    import pickle
+
+    from kicadfiles.symbol_library import Symbol
+
+    symbol = Symbol.from_sexpr(
+        '(symbol "R" (in_bom yes) (on_board yes) '
+        "(pin passive line (at 0 3.81 270) (length 1.27)))"
+    )
+    pin = symbol.pins[0]
+
+    assert not hasattr(symbol, "__dict__")
+    assert not hasattr(pin.at, "__dict__")
+    assert not hasattr(pin.length, "__dict__")
+    assert pickle.loads(pickle.dumps(symbol)).to_sexpr() == symbol.to_sexpr()
+
+
+def test_subclass_gets_its_own_field_cache():
+    """Test that a subclass does not reuse its parent's field list or serializer."""
+
+    @dataclass
+    class SignedFile(EmbeddedFile):
+        __token_name__: ClassVar[str] = "signed_file"
+
+        signature: NamedString = field(
+            default_factory=lambda: NamedString("signature", ""),
+            metadata={"description": "Signature", "required": False},
+        )
+
+    EmbeddedFile.from_sexpr('(file (name "a") (type "b"))').to_sexpr()
+    signed = SignedFile.from_sexpr(
+        '(signed_file (name "a") (type "b") (signature "c"))'
+    )
+
+    assert signed.signature.value == "c"
+    assert ["signature", "c"] in signed.to_sexpr()
+
+
 if __name__ == "__main__":
     import sys
 
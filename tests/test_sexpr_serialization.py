@@ -1,12 +1,31 @@
 #!/usr/bin/env python3
 """Test S-expression serialization for exact whitespace and format preservation."""
 
+import math
 import pathlib
 
 import pytest
 
 from kicadfiles.base_element import ParseStrictness
+from kicadfiles.enums import (
+    ChamferCorner,
+    PadProperty,
+    PadShape,
+    PadType,
+    ZoneConnection,
+)
+from kicadfiles.footprint_library import Footprint
+from kicadfiles.pad_and_drill import (
+    Drill,
+    Pad,
+    Pads,
+    PadsSoA,
+    Primitives,
+    Teardrops,
+)
 from kicadfiles.schematic_system import KicadSch
+from kicadfiles.sexpr_parser import str_to_sexpr
+from kicadfiles.symbol_library import KicadSymbolLib, Symbol
 
 # Get fixtures directory
 FIXTURES_DIR = pathlib.Path(__file__).parent / "fixtures"
@@ -205,5 +224,473 @@ def test_minimal_schematic_structural_integrity():
     ), f"Expected embedded_fonts=False, got {bool(schematic.embedded_fonts)}"
 
 
+def test_footprint_save_streams_same_content(tmp_path):
+    """Test that streamed saving writes exactly what to_sexpr_str() returns."""
+
+    footprint_path = FIXTURES_DIR / "footprints" / "RP2040-QFN-56.kicad_mod"
+    footprint = Footprint.from_file(str(footprint_path), ParseStrictness.FAILSAFE)
+
+    output_path = tmp_path / "streamed.kicad_mod"
+    footprint.save_to_file(str(output_path))
+
+    with open(output_path, "r", encoding="utf-8") as f:
+        saved_content = f.read()
+
+    assert saved_content == footprint.to_sexpr_str()
+
+
+def test_footprint_extension_check_ignores_case(tmp_path):
+    """Test that .kicad_mod is recognised regardless of case."""
+
+    footprint_path = FIXTURES_DIR / "footprints" / "small.kicad_mod"
+    footprint = Footprint.from_file(str(footprint_path))
+
+    upper_path = tmp_path / "SMALL.KICAD_MOD"
+    footprint.save_to_file(str(upper_path))
+    assert Footprint.from_file(str(upper_path)) == footprint
+
+    with pytest.raises(ValueError, match="Unsupported file extension"):
+        footprint.save_to_file(str(tmp_path / "small.kicad_mod.txt"))
+
+
+def test_footprint_named_numeric_settings():
+    """Test that footprint numeric settings parse into plain typed values."""
+
+    footprint = Footprint.from_str(
+        '(footprint "TEST" (layer "F.Cu") (solder_mask_margin 0.05) '
+        "(autoplace_cost90 3) (zone_connect 2))"
+    )
+
+    assert footprint.solder_mask_margin == 0.05
+    assert footprint.autoplace_cost90 == 3
+    assert isinstance(footprint.autoplace_cost90, int)
+    assert footprint.zone_connect == 2
+    assert footprint.solder_paste_margin is None
+
+    output = footprint.to_sexpr_str()
+    assert "(solder_mask_margin 0.05)" in output
+    assert "(autoplace_cost90 3)" in output
+    assert "solder_paste_margin" not in output
+
+
+def test_footprint_embedded_files_parse_lazily():
+    """Test that embedded files and models are parsed on first access."""
+
+    footprint_path = (
+        FIXTURES_DIR / "footprints" / "SAMTEC_MTLW-102-07-L-S-250.kicad_mod"
+    )
+    footprint = Footprint.from_file(str(footprint_path), ParseStrictness.FAILSAFE)
+
+    assert set(footprint._lazy_sexpr) == {"models", "embedded_files"}
+
+    assert len(footprint.models) == 1
+    assert "models" not in footprint._lazy_sexpr
+    assert footprint.embedded_files.files
+    assert not footprint._lazy_sexpr
+
+    embedded_file = footprint.embedded_files.files[0]
+    assert embedded_file.name == "SAMTEC_MTLW-102-07-L-S-250.step"
+    assert embedded_file.type == "model"
+    assert embedded_file.checksum == "933A830C0DA13728F69BE646E0AB956A"
+
+    reparsed = Footprint.from_str(footprint.to_sexpr_str(), ParseStrictness.FAILSAFE)
+    assert reparsed == footprint
+
+
+def test_footprint_private_layers_and_pad_groups_are_tuples():
+    """Test that private layers and net tie pad groups parse into tuples."""
+
+    footprint = Footprint.from_str(
+        '(footprint "TIE" (layer "F.Cu") (private_layers "In1.Cu" "User.1") '
+        '(net_tie_pad_groups "1, 2" "3, 4"))'
+    )
+
+    assert footprint.private_layers == ("In1.Cu", "User.1")
+    assert footprint.net_tie_pad_groups.groups == ("1, 2", "3, 4")
+
+    output = footprint.to_sexpr_str()
+    assert '(private_layers "In1.Cu" "User.1")' in output
+    assert '(net_tie_pad_groups "1, 2" "3, 4")' in output
+    assert Footprint.from_str(output) == footprint
+
+
+def test_pad_named_settings_parse_to_plain_values():
+    """Test that pad settings written as (token VALUE) parse to plain values."""
+
+    pad = Pad.from_str(
+        '(pad "1" smd roundrect (at 0 0) (size 1 1) (layers "F.Cu") '
+        '(pinfunction "GND") (pintype "passive") (die_length 0.5) '
+        "(solder_mask_margin 0.1) (zone_connect 2) (property pad_prop_heatsink))"
+    )
+
+    assert pad.pinfunction == "GND"
+    assert pad.pintype == "passive"
+    assert pad.die_length == 0.5
+    assert pad.solder_mask_margin == 0.1
+    assert pad.zone_connect == ZoneConnection.THERMAL_RELIEF
+    assert pad.property == PadProperty.HEATSINK
+    assert pad.clearance is None
+
+    output = pad.to_sexpr_str()
+    assert '(pinfunction "GND")' in output
+    assert "(zone_connect 2)" in output
+    assert "(property pad_prop_heatsink)" in output
+    assert Pad.from_str(output) == pad
+
+
+def test_teardrops_parse_to_scalars():
+    """Test that teardrop settings are stored as plain floats and bools."""
+
+    teardrops = Teardrops.from_str(
+        "(teardrops (best_length_ratio 0.5) (max_length 1) (best_width_ratio 1) "
+        "(max_width 2) (curved_edges no) (filter_ratio 0.9) (enabled yes) "
+        "(allow_two_segments yes) (prefer_zone_connections yes))"
+    )
+
+    assert teardrops.best_length_ratio == 0.5
+    assert teardrops.max_width == 2.0
+    assert teardrops.curved_edges is False
+    assert teardrops.enabled is True
+
+    output = teardrops.to_sexpr_str()
+    assert "(curved_edges no)" in output
+    assert "(enabled yes)" in output
+    assert Teardrops.from_str(output) == teardrops
+
+
+def test_pads_column_view_roundtrip():
+    """Test that the column view mirrors pad fields and writes edits back."""
+
+    footprint_path = FIXTURES_DIR / "footprints" / "RP2040-QFN-56.kicad_mod"
+    footprint = Footprint.from_file(str(footprint_path), ParseStrictness.FAILSAFE)
+    columns = Pads(pads=footprint.pads).as_soa()
+
+    assert len(columns) == len(footprint.pads)
+    assert list(columns.at_x) == [pad.at.x for pad in footprint.pads]
+    assert columns.number[0] == footprint.pads[0].number
+
+    min_x, _, max_x, _ = columns.position_bounds()
+    assert min_x == min(pad.at.x for pad in footprint.pads)
+    assert max_x == max(pad.at.x for pad in footprint.pads)
+
+    columns.at_x[0] = 42.0
+    assert columns.to_aos()[0].at.x == 42.0
+    assert footprint.pads[0].at.x == 42.0
+
+
+def test_pad_strings_are_interned():
+    """Test that repeated pad strings share one object across pads."""
+
+    sexpr = (
+        '(pad "A12" smd rect (at 0 0) (size 1 1) (layers "F.Cu") '
+        '(net 3 "GND") (pinfunction "GND") (pintype "power_in"))'
+    )
+    first = Pad.from_str(sexpr)
+    second = Pad.from_str(sexpr)
+
+    assert first.number is second.number
+    assert first.pinfunction is second.pinfunction
+    assert first.pintype is second.pintype
+    assert first.net.name is second.net.name
+
+    # Pads built directly may use a non-str number
+    assert Pad(number=1).number == 1
+
+
+def test_pad_chamfer_corners_bitmask():
+    """Test that chamfer corners parse into ChamferCorner flags."""
+
+    pad = Pad.from_str(
+        '(pad "1" smd roundrect (at 0 0) (size 1 1) (layers "F.Cu") '
+        "(chamfer_ratio 0.2) (chamfer top_left bottom_right))"
+    )
+
+    assert pad.chamfer.corners == ChamferCorner.TOP_LEFT | ChamferCorner.BOTTOM_RIGHT
+    assert pad.chamfer.corner_names == ["top_left", "bottom_right"]
+    assert pad.chamfer_ratio == 0.2
+
+    output = pad.to_sexpr_str()
+    assert "(chamfer top_left bottom_right)" in output
+    assert Pad.from_str(output) == pad
+
+    with pytest.raises(ValueError, match="Unknown chamfer corner"):
+        Pad.from_str(
+            '(pad "1" smd rect (at 0 0) (size 1 1) (layers "F.Cu") (chamfer middle))'
+        )
+
+
+def test_pad_layer_flags_are_plain_bools():
+    """Test that pad flags parse to bools from bare and yes/no forms."""
+
+    pad = Pad.from_str(
+        '(pad "1" thru_hole circle locked (at 0 0) (size 1 1) (layers "*.Cu") '
+        "(remove_unused_layers no) (keep_end_layers))"
+    )
+
+    assert pad.locked is True
+    assert pad.remove_unused_layers is False
+    assert pad.keep_end_layers is True
+    assert pad.remove_unused_layer is None
+
+    output = pad.to_sexpr_str()
+    assert "(locked yes)" in output
+    assert "(remove_unused_layers no)" in output
+    assert "remove_unused_layer " not in output
+    assert Pad.from_str(output) == pad
+
+
+def test_pad_enums_match_value_or_member_name():
+    """Test that pad enums parse from KiCad values and member names."""
+
+    pad = Pad.from_str('(pad "1" SMD roundrect (at 0 0) (size 1 1) (layers "F.Cu"))')
+    assert pad.type is PadType.SMD
+    assert pad.shape is PadShape.ROUNDRECT
+
+    output = pad.to_sexpr_str()
+    assert '(pad "1" "smd" "roundrect"' in output
+
+
+def test_primitives_fill_is_plain_bool():
+    """Test that the primitives fill flag parses to a bool."""
+
+    primitives = Primitives.from_str("(primitives (width 0.1) (fill yes))")
+    assert primitives.fill is True
+    assert "(fill yes)" in primitives.to_sexpr_str()
+
+    assert Primitives.from_str("(primitives (width 0.1))").fill is None
+
+
+def test_pad_teardrops_parse_on_first_access():
+    """Test that teardrops stay unparsed on slotted pads until read."""
+
+    pad = Pad.from_str(
+        '(pad "1" smd rect (at 0 0) (size 1 1) (layers "F.Cu") '
+        "(teardrops (best_length_ratio 0.5) (max_length 1) (best_width_ratio 1) "
+        "(max_width 2) (filter_ratio 0.9) (enabled yes)))",
+        ParseStrictness.FAILSAFE,
+    )
+
+    assert set(pad._lazy_sexpr) == {"teardrops"}
+    assert pad.teardrops.max_width == 2.0
+    assert not pad._lazy_sexpr
+    assert "(enabled yes)" in pad.to_sexpr_str()
+
+
+@pytest.mark.parametrize(
+    "cls,text,message",
+    [
+        (
+            Pad,
+            '(pad "1" smd custom (at 0 0) (size 1 1) (layers "F.Cu") '
+            "(primitives (gr_line (start 0 0))))",
+            r"primitives > elements\[0\]: Required token 'end'",
+        ),
+        (
+            Pad,
+            '(pad "1" smd custom (at 0 0) (size 1 1) (layers "F.Cu") '
+            "(options (anchor)))",
+            "options > anchor",
+        ),
+        (
+            Pad,
+            '(pad "1" smd rect (at 0 0) (size 1 1) (layers "F.Cu") '
+            "(teardrops (best_length_ratio abc)))",
+            "teardrops > best_length_ratio: Cannot convert",
+        ),
+        (
+            Footprint,
+            '(footprint "x" (layer "F.Cu") (embedded_files (file (type model))))',
+            r"embedded_files > files\[0\]: Required token 'name'",
+        ),
+    ],
+    ids=["primitives", "options", "teardrops", "embedded_files"],
+)
+def test_lazy_fields_are_validated_by_strict_parse(cls, text, message):
+    """Test that STRICT parsing reports errors in lazy fields immediately."""
+
+    with pytest.raises(ValueError, match=message):
+        cls.from_str(text, ParseStrictness.STRICT)
+
+
+def test_symbol_geometry_columns_cover_units():
+    """Test that the symbol geometry view collects pins and rectangles of units."""
+
+    symbol = Symbol.from_str(
+        '(symbol "R" (symbol "R_0_1" (rectangle (start 1 -2) (end -1 2) '
+        "(stroke (width 0) (type default)) (fill (type none)))) "
+        '(symbol "R_1_1" (pin passive line (at 0 3.81 270) (length 1.27) '
+        '(name "~") (number "1")) (pin passive line (at 0 -3.81 90) (length 1.27) '
+        '(name "~") (number "2"))))',
+        ParseStrictness.FAILSAFE,
+    )
+
+    geometry = symbol.as_geometry()
+    assert list(geometry.pin_y) == [3.81, -3.81]
+    assert list(geometry.pin_angle) == [270.0, 90.0]
+    assert list(geometry.rect_min_x) == [-1.0]
+    assert geometry.bounds() == pytest.approx((-1.0, -3.81, 1.0, 3.81))
+
+    geometry.pin_length[0] = 2.54
+    assert geometry.to_aos()[0].length.value == 2.54
+    assert symbol.units[1].pins[0].length.value == 2.54
+
+
+def test_symbol_library_lookup_by_id():
+    """Test that symbols and their parents are found by library ID."""
+
+    library = KicadSymbolLib.from_str(
+        '(kicad_symbol_lib (version 20241209) (generator "kicad_symbol_editor") '
+        '(symbol "R" (in_bom yes) (on_board yes)) '
+        '(symbol "R_Small" (extends "R")))',
+        ParseStrictness.FAILSAFE,
+    )
+
+    base, derived = library.symbols
+    assert library.get_symbol("R") is base
+    assert library.get_symbol("C") is None
+    assert derived.resolve_parent(library) is base
+    assert base.resolve_parent(library) is None
+
+    capacitor = Symbol(library_id="C")
+    library.symbols.append(capacitor)
+    assert library.get_symbol("C") is capacitor
+
+    base.library_id = "R_Renamed"
+    assert library.get_symbol("R") is None
+    assert library.get_symbol("R_Renamed") is base
+
+
+def test_pads_columns_from_raw_sexprs():
+    """Test that columns built from raw pad expressions match parsed pads."""
+
+    footprint_path = FIXTURES_DIR / "footprints" / "RP2040-QFN-56.kicad_mod"
+    content = footprint_path.read_text(encoding="utf-8")
+    pad_sexprs = [
+        item
+        for item in str_to_sexpr(content)
+        if isinstance(item, list) and str(item[0]) == "pad"
+    ]
+
+    raw_columns = PadsSoA.from_pad_sexprs(pad_sexprs, ParseStrictness.FAILSAFE)
+    parsed = Footprint.from_str(content, ParseStrictness.FAILSAFE)
+    parsed_columns = PadsSoA.from_aos(parsed.pads)
+
+    assert not raw_columns.pads
+    assert raw_columns.number == parsed_columns.number
+    assert raw_columns.at_x == parsed_columns.at_x
+    assert raw_columns.size_y == parsed_columns.size_y
+    assert raw_columns.net_number == parsed_columns.net_number
+
+    assert raw_columns.to_aos() == parsed.pads
+
+
+def test_simple_pad_fast_path_matches_generic_parse():
+    """Test that simple and full pads parse alike inside a footprint."""
+
+    simple = (
+        '(pad "1" smd roundrect (at 1 2) (size 0.5 0.6) (layers "F.Cu" "F.Mask") '
+        '(roundrect_rratio 0.25) (net 3 "GND") (pinfunction "GND") (pintype "passive") '
+        '(uuid "0b2c1a3e-1111-2222-3333-444455556666"))'
+    )
+    full = simple[:-1] + " (clearance 0.1))"
+    footprint = Footprint.from_str(f'(footprint "X" (layer "F.Cu") {simple} {full})')
+
+    fast_pad, generic_pad = footprint.pads
+    assert fast_pad.net.name == "GND"
+    assert fast_pad.pintype == "passive"
+    assert fast_pad.roundrect_rratio.value == 0.25
+    assert generic_pad.clearance == 0.1
+    generic_pad.clearance = None
+    assert fast_pad == generic_pad
+    assert fast_pad.to_sexpr() == generic_pad.to_sexpr()
+    assert fast_pad.to_sexpr() == Pad.from_str(simple).to_sexpr()
+
+
+def test_pads_optional_float_columns_use_nan_for_absent():
+    """Test that optional pad floats are stored as NaN-filled columns."""
+
+    pad_sexprs = [
+        str_to_sexpr(
+            "(pad 1 smd rect (at 0 0) (size 1 1) (layers F.Cu) (clearance 0.2))"
+        ),
+        str_to_sexpr("(pad 2 smd rect (at 1 0) (size 1 1) (layers F.Cu))"),
+    ]
+
+    raw_columns = PadsSoA.from_pad_sexprs(pad_sexprs)
+    assert raw_columns.optional_value("clearance", 0) == 0.2
+    assert raw_columns.optional_value("clearance", 1) is None
+    assert math.isnan(raw_columns.optional_floats["die_length"][0])
+
+    pads = raw_columns.to_aos()
+    parsed_columns = PadsSoA.from_aos(pads)
+    assert [pad.clearance for pad in pads] == [0.2, None]
+    assert parsed_columns.optional_value("clearance", 0) == 0.2
+    assert parsed_columns.optional_value("thermal_gap", 1) is None
+
+
+def test_union_list_elements_dispatch_by_token():
+    """Test that List[Union[...]] fields parse each item by its token."""
+
+    primitives = Primitives.from_str(
+        "(primitives (gr_line (start 0 0) (end 1 0) (width 0.1)) "
+        "(gr_circle (center 0 0) (end 0.5 0) (width 0.1)) (width 0.2))",
+        ParseStrictness.SILENT,
+    )
+
+    assert [type(element).__name__ for element in primitives.elements] == [
+        "GrLine",
+        "GrCircle",
+    ]
+    assert "(gr_circle" in primitives.to_sexpr_str()
+
+    footprint_path = FIXTURES_DIR / "footprints" / "RP2040-QFN-56.kicad_mod"
+    footprint = Footprint.from_file(str(footprint_path))
+    content = footprint_path.read_text(encoding="utf-8")
+    assert len(footprint.fp_elements) == content.count("(fp_line") + content.count(
+        "(fp_text"
+    )
+
+
+def test_drill_oval_is_bare_bool():
+    """Test that the oval drill flag is a bool written as a bare symbol."""
+
+    oval = Drill.from_str("(drill oval 1.2 0.8 (offset 0.1 0))")
+    assert oval.oval is True
+    assert oval.diameter == 1.2
+    assert oval.width == 0.8
+    assert oval.to_sexpr()[:4] == ["drill", "oval", 1.2, 0.8]
+
+    round_drill = Drill.from_str("(drill 0.9)")
+    assert round_drill.oval is None
+    assert round_drill.diameter == 0.9
+    assert round_drill.to_sexpr() == ["drill", 0.9]
+
+
+def test_custom_pad_primitives_parse_and_save_strict():
+    """Test that custom pad primitives without layer or uuid work in STRICT."""
+
+    footprint_path = FIXTURES_DIR / "footprints" / "custom_pad.kicad_mod"
+    footprint = Footprint.from_file(str(footprint_path), ParseStrictness.STRICT)
+
+    primitives = footprint.pads[0].primitives
+    assert [type(element).__name__ for element in primitives.elements] == [
+        "GrCircle",
+        "GrLine",
+        "GrArc",
+        "GrRect",
+        "GrPoly",
+    ]
+
+    saved = footprint.to_sexpr_str()
+    assert "(layer" not in saved[saved.index("(primitives") :]
+    reparsed = Footprint.from_str(saved, ParseStrictness.STRICT)
+    assert reparsed.pads[0].primitives == primitives
+
+    content = footprint_path.read_text(encoding="utf-8")
+    pad_text = content[content.index("(pad") : content.rindex(")")]
+    pad = Pad.from_str(pad_text, ParseStrictness.STRICT)
+    assert pad.primitives == primitives
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "-s"])